@@ -0,0 +1,54 @@
+"""
+Throughput and peak memory of bulk_register(), with a check that every
+duplicate username or email is rejected.
+
+Run from the repository root:
+    python Checks/bulk_register_benchmark.py [N] [PROCESSES]
+N defaults to 10,000,000 records, which needs several GB of memory for the
+store; PROCESSES defaults to one per CPU. Hashing uses 1 iteration, so the
+numbers measure the pipeline rather than PBKDF2.
+"""
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from LoginForm import CredentialStore, bulk_register  # noqa: E402
+
+
+# Every 100th record repeats an earlier username, and every 100th (offset
+# by 50) an earlier email, so 2% of the records are duplicates.
+def make_records(count):
+    for number in range(count):
+        username = f"user{number}"
+        email = f"user{number}@example.com"
+        if number % 100 == 99:
+            username = f"user{number - 1}"
+        elif number % 100 == 49:
+            email = f"user{number - 1}@example.com"
+        yield username, "password", email
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    store = CredentialStore(iterations=1)
+    report = bulk_register(store, make_records(count), batch_size=50_000,
+                           processes=processes)
+    store.close()
+
+    duplicates = count // 100 + (count + 50) // 100
+    assert report["duplicates"] == duplicates, report
+    assert report["registered"] == len(store) == count - duplicates, report
+    print(f"{count:,} records: {report['registered']:,} registered, "
+          f"{report['duplicates']:,} duplicates rejected")
+    print(f"  {report['records_per_second']:,.0f} records/s, "
+          f"peak memory {report.get('peak_memory_kb', 0) / 1024:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
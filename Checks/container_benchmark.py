@@ -0,0 +1,114 @@
+"""
+Benchmark of CustomContainer membership tests: the indexed container's
+hash lookup against the list scan of the original __contains__ example.
+Then compares memory and iteration speed of list storage against typed
+array storage. Also checks that views follow the container as it grows
+and shrinks, which buffers are shared rather than copied, and that a
+rejected assignment does not corrupt the hash index.
+
+Run from the repository root:  python Checks/container_benchmark.py [N]
+"""
+import contextlib
+import io
+import os
+import runpy
+import sys
+import timeit
+from array import array
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "Examples", "ClassInheritance&MagicMethods.py")
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    example = runpy.run_path(EXAMPLE)
+CustomContainer = example["CustomContainer"]
+
+LOOKUPS = 200
+
+
+# The original `__contains__` example: a plain scan of the list.
+class ScanningContainer:
+    def __init__(self, items):
+        self.items = items
+
+    def __contains__(self, item):
+        return item in self.items
+
+
+def check_views():
+    container = CustomContainer(range(10))
+    view = container[2:8]
+    every_other = view[1::2]
+    del container[0:5]
+    assert list(view) == [7, 8, 9] and list(every_other) == [8]
+    container.extend(range(100, 105))
+    assert list(view) == [7, 8, 9, 100, 101, 102]
+    assert list(every_other) == [8, 100, 102]
+    print("Views follow inserts and deletes")
+
+
+def check_shared_storage():
+    grades = array("d", [1.0, 2.0])
+    assert CustomContainer(grades).items is grades  # Shared
+    fixed = CustomContainer(b"ab")  # Read-only: copied into an array
+    fixed.append(99)
+    assert fixed.items == array("B", b"abc")
+    print("Only mutable buffers are shared; others are copied")
+
+
+def check_failed_assignment():
+    container = CustomContainer([1.0, 2.0], typecode="d", indexed=True)
+    try:
+        container[0] = "x"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("text was stored in a typed array")
+    assert 1.0 in container and list(container) == [1.0, 2.0]
+    container[0] = 3
+    assert 3.0 in container and 1.0 not in container
+    print("A rejected assignment leaves the index unchanged")
+
+
+def per_lookup(statement, number):
+    return min(timeit.repeat(statement, number=number, repeat=3)) / number
+
+
+def main(count):
+    check_views()
+    check_shared_storage()
+    check_failed_assignment()
+    items = [f"item{number}" for number in range(count)]
+    containers = [
+        ("original (list scan)", ScanningContainer(items)),
+        ("CustomContainer", CustomContainer(items)),
+        ("CustomContainer(indexed)", CustomContainer(items, indexed=True)),
+    ]
+    print(f"'in' on {count:,} items (worst case: last item)")
+    for label, container in containers:
+        target = items[-1]
+        assert target in container and "missing" not in container
+        seconds = per_lookup(lambda: target in container, LOOKUPS)
+        print(f"  {label:<28}{seconds * 1e6:>12,.2f} us/lookup")
+
+
+def compare_storage(count):
+    boxed = CustomContainer([float(number) for number in range(count)])
+    typed = CustomContainer(range(count), typecode="d")
+    print(f"Storage for {count:,} floats")
+    for label, container in (("list", boxed), ("array('d')", typed)):
+        items = container.items
+        size = sys.getsizeof(items)
+        if isinstance(items, list):
+            size += sum(map(sys.getsizeof, items))  # Each boxed float
+        loop = min(timeit.repeat(lambda: sum(value for value in container),
+                                 number=1, repeat=3))
+        raw = min(timeit.repeat(lambda: sum(items), number=1, repeat=3))
+        print(f"  {label:<12}{size / 2**20:>8.1f} MB   for-loop {loop:.3f}s"
+              f"   sum(items) {raw:.3f}s")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    main(count)
+    compare_storage(count)
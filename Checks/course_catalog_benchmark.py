@@ -0,0 +1,111 @@
+"""
+Benchmark of CourseCatalog lookups against scanning a plain list of
+courses, plus checks that the indexes return the same courses, that
+edited courses can still be removed, and that imported IDs are never
+handed out again.
+
+Run from the repository root:  python Checks/course_catalog_benchmark.py [N]
+(N defaults to 1,000,000 courses).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from practical_task_1 import CourseCatalog, OOPCourse  # noqa: E402
+
+TOPICS = ["python", "java", "sql", "design", "testing", "networks", "data",
+          "security", "cloud", "web"]
+LOOKUPS = 1000
+
+
+def build(count):
+    catalog = CourseCatalog()
+    courses = []
+    for i in range(count):
+        description = (f"{TOPICS[i % 10]} {TOPICS[i // 10 % 10]} "
+                       f"module{i % 5000}")
+        courses.append(catalog.create(f"Course {i}", description,
+                                      f"Trainer {i % 1000}"))
+    return catalog, courses
+
+
+def check_edit_and_import():
+    catalog = CourseCatalog()
+    course = catalog.create("A", "python basics", "Trainer A")
+    course.description, course.trainer = "sql joins", "Trainer B"
+    catalog.remove(course)  # Indexed under the old trainer and words
+    assert not catalog.search("python") and not catalog.by_trainer("Trainer A")
+    assert len(catalog) == 0
+
+    # Export, then import into a catalog whose allocator is behind the IDs
+    next_id = OOPCourse.id_allocator.reserve(0)
+    rows = [{"course_id": f"#{next_id + offset}", "name": "C",
+             "description": "imported", "trainer": "T"} for offset in (0, 9)]
+    catalog.import_rows(rows)
+    fresh = catalog.create("D", "new", "T")  # Would be a duplicate before
+    assert int(fresh.course_id[1:]) > next_id + 9, fresh.course_id
+    print("Edited courses are removed cleanly; imported IDs are not reused")
+
+
+def timed(label, function, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        function(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28}{elapsed / repeat * 1e6:>12,.1f} us/lookup")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    # A course is never registered unless asked, so reusing an ID (e.g.
+    # after swapping allocators) cannot break construction.
+    OOPCourse("A", "first", "T", course_id="#1")
+    OOPCourse("B", "second", "T", course_id="#1")
+    catalog = CourseCatalog()
+    catalog.create("A", "first", "T", course_id="#1")
+    try:
+        catalog.create("B", "second", "T", course_id="#1")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("duplicate course ID was registered")
+    assert len(catalog) == 1
+    check_edit_and_import()
+
+    start = time.perf_counter()
+    catalog, courses = build(count)
+    print(f"Built {count:,} courses in {time.perf_counter() - start:.1f}s")
+
+    # Indexes and scans must agree
+    sample = courses[count // 2]
+    assert catalog.get(sample.course_id) is sample
+    assert (sorted(c.course_id for c in catalog.by_trainer("Trainer 7")) ==
+            sorted(c.course_id for c in courses if c.trainer == "Trainer 7"))
+    assert ({c.course_id for c in catalog.search("module42 sql")} ==
+            {c.course_id for c in courses
+             if {"module42", "sql"} <= set(c.description.split())})
+
+    print("Catalog:")
+    timed("get(course_id)",
+          lambda i: catalog.get(courses[i * 997 % count].course_id), LOOKUPS)
+    timed("by_trainer(trainer)",
+          lambda i: catalog.by_trainer(f"Trainer {i % 1000}"), LOOKUPS)
+    timed("search('moduleN python')",
+          lambda i: catalog.search(f"module{i % 5000} python"), LOOKUPS)
+
+    print("List scan:")
+    timed("course_id", lambda i: next(
+        c for c in courses if c.course_id == courses[-1 - i].course_id), 5)
+    timed("trainer", lambda i: [
+        c for c in courses if c.trainer == f"Trainer {i}"], 5)
+
+
+if __name__ == "__main__":
+    main()
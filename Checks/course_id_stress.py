@@ -0,0 +1,99 @@
+"""
+Stress test for the OOPCourse ID allocators: creates courses from many
+threads and processes at once and asserts that no course ID repeats.
+
+Run from the repository root:  python Checks/course_id_stress.py [N]
+N (default 1,000,000) courses are created in total. Nine tenths are split
+between LockedIdAllocator and BlockIdAllocator across threads; the rest
+use FileIdAllocator across processes, as each of its IDs takes a flock.
+"""
+import contextlib
+import io
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from practical_task_1 import (BlockIdAllocator,  # noqa: E402
+                                  FileIdAllocator, LockedIdAllocator,
+                                  OOPCourse)
+
+THREADS = 8
+PROCESSES = 4
+ID_FORMAT = re.compile(r"#\d+")
+
+
+def create_courses(count):
+    return [OOPCourse("OOPCourse", "OOP Fundamentals", "Trainer").course_id
+            for _ in range(count)]
+
+
+def create_in_threads(count):
+    results = [None] * THREADS
+
+    def worker(slot):
+        results[slot] = create_courses(count // THREADS)
+
+    threads = [threading.Thread(target=worker, args=(slot,))
+               for slot in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [course_id for ids in results for course_id in ids]
+
+
+# Runs in each worker process: every process has its own FileIdAllocator
+# on the shared counter file, used from several threads.
+def create_in_process(path, count):
+    OOPCourse.id_allocator = FileIdAllocator(path, 12345)
+    return create_in_threads(count)
+
+
+def check_unique(label, course_ids, expected):
+    assert len(course_ids) == expected, (label, len(course_ids))
+    assert len(set(course_ids)) == expected, f"{label}: duplicate IDs"
+    assert all(ID_FORMAT.fullmatch(course_id) for course_id in course_ids), \
+        f"{label}: badly formatted ID"
+    print(f"{label:<20}{expected:>10,} courses, all IDs unique")
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    try:
+        BlockIdAllocator(1, block_size=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("block_size=0 was accepted")
+
+    # Threads
+    per_allocator = total * 9 // 20 // THREADS * THREADS
+    for label, allocator in (
+            ("LockedIdAllocator", LockedIdAllocator(12345)),
+            ("BlockIdAllocator", BlockIdAllocator(12345, block_size=1000))):
+        OOPCourse.id_allocator = allocator
+        check_unique(label, create_in_threads(per_allocator), per_allocator)
+
+    # Processes (each with its own threads)
+    per_process = (total - 2 * per_allocator) // PROCESSES
+    per_process -= per_process % THREADS
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "course_id")
+        with multiprocessing.Pool(PROCESSES) as pool:
+            results = pool.starmap(create_in_process,
+                                   [(path, per_process)] * PROCESSES)
+    check_unique("FileIdAllocator", [course_id for ids in results
+                                     for course_id in ids],
+                 per_process * PROCESSES)
+
+
+if __name__ == "__main__":
+    main()
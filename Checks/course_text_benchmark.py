@@ -0,0 +1,82 @@
+"""
+Benchmark of Course.contact_details()/head_office_text(), which return
+text rendered once per class, against building the f-string on every call
+(the original code) and against a value-keyed lru_cache. Also checks that
+reassigning the class attributes updates the text on subclasses.
+
+Run from the repository root:  python Checks/course_text_benchmark.py
+"""
+import contextlib
+import io
+import os
+import sys
+import timeit
+from functools import lru_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from practical_task_1 import Course, OOPCourse  # noqa: E402
+
+CALLS = 1_000_000
+
+
+# The original method, formatting on every call.
+class FormattingCourse:
+    contact_website = Course.contact_website
+
+    def contact_details(self):
+        return f"""\nPlease contact us by visiting our website:
+        {self.contact_website}"""
+
+
+@lru_cache(maxsize=None)
+def render_cached(contact_website):
+    return f"""\nPlease contact us by visiting our website:
+        {contact_website}"""
+
+
+# A module-global lru_cache keyed by the attribute value.
+class LruCourse(FormattingCourse):
+    def contact_details(self):
+        return render_cached(self.contact_website)
+
+
+def check_invalidation():
+    course = OOPCourse("OOPCourse", "OOP Fundamentals", "Trainer")
+    original = Course.address
+    try:
+        Course.address = "Durban"
+        assert course.head_office_text() == "\nHead office location: Durban"
+        OOPCourse.address = "Joburg"
+        assert course.head_office_text() == "\nHead office location: Joburg"
+        assert Course("x").head_office_text() == \
+            "\nHead office location: Durban"
+        del OOPCourse.address  # Inherits Course's value again
+        assert course.head_office_text() == "\nHead office location: Durban"
+        course.address = "Home"  # Instance override
+        assert course.head_office_text() == "\nHead office location: Home"
+        del course.address
+        assert course.head_office_text() == "\nHead office location: Durban"
+    finally:
+        Course.address = original
+    assert course.contact_details() == FormattingCourse().contact_details()
+    print("Text follows class, subclass and instance reassignment")
+
+
+def main():
+    check_invalidation()
+    cases = [
+        ("f-string per call", FormattingCourse()),
+        ("lru_cache by value", LruCourse()),
+        ("rendered per class", OOPCourse("OOPCourse", "OOP", "Trainer")),
+    ]
+    for label, course in cases:
+        seconds = min(timeit.repeat(course.contact_details, number=CALLS,
+                                    repeat=5))
+        print(f"{label:<22}{seconds:>8.3f}s per {CALLS:,} calls")
+
+
+if __name__ == "__main__":
+    main()
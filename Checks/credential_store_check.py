@@ -0,0 +1,162 @@
+"""
+Checks that CredentialStore never keeps plaintext passwords, that records
+keep their own hashing cost, that concurrent registrations of one name
+or email cannot both succeed, and that identical in-flight logins share
+one check under a keyed (not plain) hash. Then benchmarks registrations and logins per
+second with 1M users already in the store.
+
+Run from the repository root:  python Checks/credential_store_check.py [N]
+"""
+import asyncio
+import contextlib
+import hashlib
+import io
+import os
+import secrets
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from LoginForm import (CredentialStore, LoginForm,  # noqa: E402
+                           LoginService, RegisterForm, SessionCache,
+                           bulk_register, hash_password)
+
+ITERATIONS = 1000
+SAMPLES = 200
+
+
+def check_plaintext_not_kept():
+    # A password made at run time has no other references (e.g. constants),
+    # so its reference count shows whether anything still holds it.
+    password = secrets.token_hex(16)
+    baseline = sys.getrefcount(password)
+
+    store = CredentialStore(iterations=ITERATIONS)
+    forms = [RegisterForm("alice", password, "alice@example.com"),
+             LoginForm("alice", password), LoginForm("alice", password),
+             LoginForm("alice", password), LoginForm("alice", password)]
+    store.register(forms[0])
+    assert store.verify(forms[1])
+    assert store.login(forms[2]).result()
+    assert asyncio.run(LoginService(store).login(forms[3]))
+    assert SessionCache().login(store, forms[4]) is not None
+    bulk_register(store, [RegisterForm("bob", password, "bob@example.com")],
+                  processes=1)
+    store.close()
+
+    assert all(form.password is None for form in forms), "form kept password"
+    for username in ("alice", "bob"):
+        salt, password_hash, iterations = store._users[username]
+        assert isinstance(salt, bytes) and isinstance(password_hash, bytes)
+        assert password.encode() not in (salt, password_hash)
+    del forms
+    assert sys.getrefcount(password) == baseline, "plaintext still referenced"
+
+    try:
+        store.verify(LoginForm("alice", None))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("a used form was accepted")
+    print("No plaintext kept on forms, records or services")
+
+
+def check_iterations_per_record():
+    store = CredentialStore(iterations=ITERATIONS)
+    store.register(RegisterForm("old", "secret", "old@example.com"))
+    store.iterations = ITERATIONS * 2  # Raise the cost for new users only
+    store.register(RegisterForm("new", "secret", "new@example.com"))
+    assert store.verify(LoginForm("old", "secret"))
+    assert store.verify(LoginForm("new", "secret"))
+    assert store._users["new"][2] == ITERATIONS * 2
+    store.close()
+    print("Changing iterations keeps existing users working")
+
+
+def check_concurrent_registrations():
+    store = CredentialStore(iterations=20_000)
+    results = []
+    barrier = threading.Barrier(8)
+
+    def register(number):
+        # Half the threads reuse one name, the other half one email
+        form = (RegisterForm("same", "pw", f"user{number}@example.com")
+                if number % 2 else
+                RegisterForm(f"user{number}", "pw", "same@example.com"))
+        barrier.wait()
+        try:
+            store.register(form)
+            results.append(True)
+        except ValueError:
+            results.append(False)
+
+    threads = [threading.Thread(target=register, args=(number,))
+               for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results.count(True) == 2, results  # One per name, one per email
+    store.close()
+    print("Concurrent duplicate registrations are rejected")
+
+
+def check_login_dedup():
+    store = CredentialStore(iterations=ITERATIONS)
+    store.register(RegisterForm("carol", "secret", "carol@example.com"))
+    keys = []
+
+    async def login_twice(service):
+        logins = [asyncio.ensure_future(
+            service.login(LoginForm("carol", "secret"))) for _ in range(2)]
+        await asyncio.sleep(0)  # Both logins are now waiting
+        assert len(service._in_flight) == 1  # ...on a single check
+        keys.extend(service._in_flight)
+        return await asyncio.gather(*logins)
+
+    for service in (LoginService(store), LoginService(store)):
+        assert all(asyncio.run(login_twice(service)))
+    store.close()
+    assert keys[0][1] != hashlib.sha256(b"secret").digest()
+    assert keys[0] != keys[1]  # Each service has its own HMAC key
+    print("Identical logins share one check, keyed by a per-service HMAC")
+
+
+def benchmark(users):
+    store = CredentialStore(iterations=ITERATIONS)
+    salt = os.urandom(16)
+    password_hash = hash_password("password", salt, ITERATIONS)
+    start = time.perf_counter()
+    for number in range(users):  # Pre-hashed, so filling 1M users is quick
+        store.add_hashed(f"user{number}", salt, password_hash,
+                         f"user{number}@example.com")
+    print(f"Loaded {users:,} users in {time.perf_counter() - start:.1f}s "
+          f"(iterations={ITERATIONS})")
+
+    start = time.perf_counter()
+    for number in range(SAMPLES):
+        store.register(RegisterForm(f"new{number}", "password",
+                                    f"new{number}@example.com"))
+    rate = SAMPLES / (time.perf_counter() - start)
+    print(f"  register()        {rate:>10,.0f} per second")
+
+    start = time.perf_counter()
+    futures = [store.login(LoginForm(f"user{number * 997 % users}",
+                                     "password"))
+               for number in range(SAMPLES)]
+    assert all(future.result() for future in futures)
+    rate = SAMPLES / (time.perf_counter() - start)
+    print(f"  login() (pool)    {rate:>10,.0f} per second")
+    store.close()
+
+
+if __name__ == "__main__":
+    check_plaintext_not_kept()
+    check_iterations_per_record()
+    check_concurrent_registrations()
+    check_login_dedup()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,67 @@
+"""
+Benchmark of driving_eligibility() over a whole population against calling
+can_drive() on one Adult or Child object per person, plus a check that
+mismatched ages and jurisdictions are rejected instead of truncated.
+
+Run from the repository root:
+    python Checks/driving_eligibility_benchmark.py [N]
+(N defaults to 1,000,000 people).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from method_override import (DRIVING_AGE, create_person,  # noqa: E402
+                                 driving_eligibility, np)
+
+PLACES = ("UK", "US", "NZ", "DE")
+THRESHOLDS = {"US": 16, "NZ": 16}
+
+
+def check_lengths():
+    try:
+        driving_eligibility([20, 15, 17], ["UK", "US"], THRESHOLDS)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("mismatched lengths were accepted")
+    print("Mismatched ages and jurisdictions are rejected")
+
+
+def main(count):
+    check_lengths()
+    ages = [number % 90 for number in range(count)]
+    places = [PLACES[number % len(PLACES)] for number in range(count)]
+    people = [create_person("Person", age, "blue", "black") for age in ages]
+    print(f"Who may drive, {count:,} people "
+          f"({'NumPy' if np is not None else 'pure Python'})")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for person in people:
+            person.can_drive()
+    per_object = time.perf_counter() - start
+    print(f"  can_drive() per object      {per_object:>8.3f}s")
+
+    start = time.perf_counter()
+    mask, count_ = driving_eligibility(ages)
+    print(f"  driving_eligibility()       "
+          f"{time.perf_counter() - start:>8.3f}s")
+    assert count_ == sum(age >= DRIVING_AGE for age in ages)
+
+    start = time.perf_counter()
+    mask, count_ = driving_eligibility(ages, places, THRESHOLDS)
+    print(f"  ... with jurisdictions      "
+          f"{time.perf_counter() - start:>8.3f}s")
+    assert count_ == sum(age >= THRESHOLDS.get(place, DRIVING_AGE)
+                         for age, place in zip(ages, places))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
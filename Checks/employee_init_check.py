@@ -0,0 +1,111 @@
+"""
+Counts how often each base initializer runs while building the employee
+hierarchy in TemplateEmployee.py, and benchmarks construction against the
+original explicit-call TeamLead.
+
+Run from the repository root:  python Checks/employee_init_check.py
+"""
+import contextlib
+import io
+import os
+import sys
+import timeit
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    import TemplateEmployee as employees  # noqa: E402
+
+CALLS = 200_000
+
+
+# The original hierarchy, where TeamLead calls Manager.__init__ and then
+# Developer.__init__, so TemplateEmployee.__init__ runs twice.
+class OldEmployee:
+    def __init__(self, name, salary, position):
+        self.name = name
+        self.salary = salary
+        self.position = position
+
+
+class OldManager(OldEmployee):
+    def __init__(self, name, salary, position, team_size):
+        OldEmployee.__init__(self, name, salary, position)
+        self.team_size = team_size
+
+
+class OldDeveloper(OldEmployee):
+    def __init__(self, name, salary, position, language):
+        OldEmployee.__init__(self, name, salary, position)
+        self.language = language
+
+
+class OldTeamLead(OldManager, OldDeveloper):
+    def __init__(self, name, salary, position, language, team_size,
+                 responsibility):
+        OldManager.__init__(self, name, salary, position, team_size)
+        OldDeveloper.__init__(self, name, salary, position, language)
+        self.responsibility = responsibility
+
+
+# Replace each class's __init__ with a wrapper that counts its calls.
+@contextlib.contextmanager
+def counting(classes):
+    calls = Counter()
+    originals = {cls: cls.__dict__["__init__"] for cls in classes}
+
+    def wrap(cls, init):
+        def counted(self, *args, **kwargs):
+            calls[cls.__name__] += 1
+            init(self, *args, **kwargs)
+        return counted
+
+    for cls, init in originals.items():
+        cls.__init__ = wrap(cls, init)
+    try:
+        yield calls
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+
+
+def check_init_counts():
+    cases = [
+        (employees.TeamLead,
+         (employees.TemplateEmployee, employees.Manager, employees.Developer,
+          employees.TeamLead)),
+        (employees.SlottedTeamLead,
+         (employees.SlottedEmployee, employees.ManagerRole,
+          employees.DeveloperRole, employees.SlottedTeamLead)),
+    ]
+    for lead_class, classes in cases:
+        with counting(classes) as calls:
+            lead = lead_class(name="Carl", salary=120000, position="Team Lead",
+                              language="C++", team_size=3,
+                              responsibility="Project Leader")
+        assert all(calls[cls.__name__] == 1 for cls in classes), calls
+        assert (lead.name, lead.language, lead.team_size) == ("Carl", "C++", 3)
+        print(f"{lead_class.__name__:<16} each initializer ran once: "
+              f"{dict(calls)}")
+
+    with counting((OldEmployee,)) as calls:
+        OldTeamLead("Carl", 120000, "Team Lead", "C++", 3, "Project Leader")
+    assert calls["OldEmployee"] == 2
+    print(f"{'Original':<16} base initializer ran {calls['OldEmployee']} times")
+
+
+def benchmark():
+    args = ("Carl", 120000, "Team Lead", "C++", 3, "Project Leader")
+    for label, cls in (("Original TeamLead", OldTeamLead),
+                       ("TeamLead", employees.TeamLead),
+                       ("SlottedTeamLead", employees.SlottedTeamLead)):
+        seconds = min(timeit.repeat(lambda: cls(*args), number=CALLS,
+                                    repeat=5))
+        print(f"{label:<20}{seconds / CALLS * 1e9:>8.0f} ns per object")
+
+
+if __name__ == "__main__":
+    check_init_counts()
+    benchmark()
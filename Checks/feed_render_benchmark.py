@@ -0,0 +1,95 @@
+"""
+Before/after benchmark of listing feeds at 500k listings. "Before" is the
+original Property hierarchy, which formats a listing on every str() call;
+"after" is the current one, whose __setattr__ hook keeps a cached
+description. Both the construction cost (where the hook runs on every
+attribute) and the feed rendering cost are reported, for a first render
+and for repeated renders of the same listings.
+
+Run from the repository root:  python Checks/feed_render_benchmark.py [N]
+(N defaults to 500,000 listings).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from Property import Apartment, House, render_feed  # noqa: E402
+
+RENDERS = 3
+
+
+# The original classes: no hook, and __str__ formats the text every time.
+class OldProperty:
+    def __init__(self, location, price, property_type):
+        self.location = location
+        if price < 50000:
+            price = 0
+        self.price = price
+        self.property_type = property_type
+
+    def __str__(self):
+        return (f"This {self.property_type} is located at: {self.location}, "
+                f"and costs {self.price} USD")
+
+
+class OldApartment(OldProperty):
+    def __init__(self, location, price, property_type, floor):
+        super().__init__(location, price, property_type)
+        self.floor = floor
+
+    def __str__(self):
+        return super().__str__() + f". It is located on floor {self.floor}"
+
+
+class OldHouse(OldProperty):
+    def __init__(self, location, price, property_type, bedrooms, garden_size):
+        super().__init__(location, price, property_type)
+        self.bedrooms = bedrooms
+        self.garden_size = garden_size
+
+    def __str__(self):
+        return super().__str__() + (
+            f".\n It has {self.bedrooms} bedrooms and a garden with size "
+            f"{self.garden_size} sq.m.")
+
+
+def build(apartment, house, count):
+    return [apartment(f"Street {number}", 40_000 + number, "Apartment",
+                      number % 20)
+            if number % 2 else
+            house(f"Street {number}", 40_000 + number, "House",
+                  number % 5 + 1, number % 500)
+            for number in range(count)]
+
+
+def measure(label, apartment, house, count):
+    start = time.perf_counter()
+    listings = build(apartment, house, count)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    feed = render_feed(listings)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        assert render_feed(listings) == feed
+    again = (time.perf_counter() - start) / RENDERS
+    print(f"  {label:<10}build {built:>6.3f}s   first render {first:>6.3f}s"
+          f"   later renders {again:>6.3f}s")
+    return feed
+
+
+def main(count):
+    print(f"Feed of {count:,} listings")
+    before = measure("before", OldApartment, OldHouse, count)
+    after = measure("after", Apartment, House, count)
+    assert before == after
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,108 @@
+"""
+Crash-recovery check and benchmark for HiLoIdAllocator.
+
+The check starts a child process that allocates IDs and reports them, kills
+it with SIGKILL part-way through a block, and asserts that a fresh
+allocator on the same file never hands out an ID the child already used.
+A second check runs several processes on one file at once and asserts that
+their IDs never overlap.
+The benchmark reports allocations per second with blocks of 1, 100 and
+10,000 IDs.
+
+Run from the repository root:  python Checks/hilo_allocator_check.py
+"""
+import contextlib
+import io
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+TASKS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                     "..", "Practical_Tasks")
+sys.path.insert(0, TASKS)
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from practical_task_1 import HiLoIdAllocator  # noqa: E402
+
+# Run by the child: allocate forever, printing every ID as it is handed out.
+CHILD = """
+import contextlib, io, sys
+sys.path.insert(0, sys.argv[1])
+with contextlib.redirect_stdout(io.StringIO()):
+    from practical_task_1 import HiLoIdAllocator
+allocator = HiLoIdAllocator(sys.argv[2], 12345, block_size=int(sys.argv[3]))
+while True:
+    print(allocator.allocate(), flush=True)
+"""
+
+# Run by the concurrent check: allocate a fixed number of IDs, then exit.
+WORKER = """
+import contextlib, io, sys
+sys.path.insert(0, sys.argv[1])
+with contextlib.redirect_stdout(io.StringIO()):
+    from practical_task_1 import HiLoIdAllocator
+allocator = HiLoIdAllocator(sys.argv[2], 12345, block_size=1)
+for _ in range(int(sys.argv[3])):
+    print(allocator.allocate())
+"""
+
+
+def check_recovery(path, block_size, rounds=5):
+    used = set()
+    for _ in range(rounds):
+        child = subprocess.Popen(
+            [sys.executable, "-c", CHILD, TASKS, path, str(block_size)],
+            stdout=subprocess.PIPE, text=True)
+        for _ in range(block_size + block_size // 2 + 1):  # Stop mid-block
+            used.add(int(child.stdout.readline()))
+        os.kill(child.pid, signal.SIGKILL)
+        child.wait()
+        child.stdout.close()
+
+        allocator = HiLoIdAllocator(path, 12345, block_size=block_size)
+        fresh = allocator.allocate()
+        assert fresh not in used and fresh > max(used), (fresh, max(used))
+    print(f"block_size={block_size:<6} no ID reused after {rounds} kill -9s")
+
+
+def check_concurrent_processes(path, processes=4, count=500):
+    workers = [subprocess.Popen(
+        [sys.executable, "-c", WORKER, TASKS, path, str(count)],
+        stdout=subprocess.PIPE, text=True) for _ in range(processes)]
+    ids = []
+    for worker in workers:
+        ids.extend(map(int, worker.communicate()[0].split()))
+    assert len(ids) == processes * count, len(ids)
+    assert len(set(ids)) == len(ids), "processes reserved the same block"
+    print(f"{processes} processes sharing one file: {len(ids):,} unique IDs")
+
+
+def benchmark(directory, block_size, seconds=1.0):
+    path = os.path.join(directory, f"bench_{block_size}")
+    allocator = HiLoIdAllocator(path, 1, block_size=block_size)
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            allocator.allocate()
+        count += 100
+    rate = count / (time.perf_counter() - start)
+    print(f"block_size={block_size:<6}{rate:>14,.0f} allocations/s")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for block_size in (1, 100):
+            check_recovery(os.path.join(directory, f"crash_{block_size}"),
+                           block_size)
+        check_concurrent_processes(os.path.join(directory, "shared"))
+        for block_size in (1, 100, 10_000):
+            benchmark(directory, block_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Cold-start benchmark of ListingCatalog: the time to open a binary catalog
+and read one listing, for catalogs of increasing size, against loading the
+same listings from JSON Lines. Also checks that empty or truncated files
+are rejected as "not a listing catalog".
+
+Run from the repository root:  python Checks/listing_catalog_benchmark.py [N]
+(N is the largest catalog size and defaults to 1,000,000 listings).
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from Property import (Apartment, House, ListingCatalog,  # noqa: E402
+                          load_listings, write_catalog)
+
+OPENS = 20
+
+
+def make_listings(count):
+    for number in range(count):
+        if number % 2:
+            yield Apartment(f"Street {number}", 40_000 + number, "Apartment",
+                            number % 20)
+        else:
+            yield House(f"Street {number}", 90_000 + number, "House",
+                        number % 5 + 1, number % 500)
+
+
+def check_bad_files(directory):
+    for name, data in (("empty.bin", b""), ("short.bin", b"PROP"),
+                       ("other.bin", b"x" * 64)):
+        path = os.path.join(directory, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        try:
+            ListingCatalog(path)
+        except ValueError as e:
+            assert "not a listing catalog" in str(e), e
+        else:
+            raise AssertionError(f"{name} was opened")
+    print("Empty, truncated and foreign files are rejected")
+
+
+def cold_start(path, index):
+    start = time.perf_counter()
+    for _ in range(OPENS):
+        with ListingCatalog(path) as catalog:
+            str(catalog[index])
+    return (time.perf_counter() - start) / OPENS
+
+
+def main(largest):
+    sizes = sorted({max(largest // 1000, 1), max(largest // 10, 1), largest})
+    with tempfile.TemporaryDirectory() as directory:
+        check_bad_files(directory)
+        print("Open a catalog and read its last listing")
+        for count in sizes:
+            path = os.path.join(directory, f"catalog_{count}.bin")
+            write_catalog(path, make_listings(count))
+            seconds = cold_start(path, count - 1)
+
+            jsonl_path = os.path.join(directory, f"listings_{count}.jsonl")
+            with open(jsonl_path, "w", encoding="utf-8") as file:
+                for listing in make_listings(count):
+                    row = dict(vars(listing), price=listing.raw_price,
+                               kind=type(listing).__name__)
+                    file.write(json.dumps(row) + "\n")
+            start = time.perf_counter()
+            for listing in load_listings(jsonl_path):
+                pass
+            loaded = time.perf_counter() - start
+            print(f"  {count:>10,} listings   ListingCatalog "
+                  f"{seconds * 1e6:>8,.0f} us   load_listings() "
+                  f"{loaded:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,126 @@
+"""
+Throughput benchmark for load_listings() on CSV and JSON Lines files,
+serially and with worker processes, plus checks for empty files, for
+quoted CSV fields containing line breaks, and that bad records are
+reported one by one without losing the valid records around them.
+
+Run from the repository root:  python Checks/listing_loader_benchmark.py [N]
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from Property import iter_listings, load_listings  # noqa: E402
+
+FIELDS = ["kind", "location", "price", "property_type", "floor", "bedrooms",
+          "garden_size", "business_type", "parking_slots"]
+
+
+def make_rows(count):
+    for i in range(count):
+        if i % 3 == 0:
+            yield {"kind": "apartment", "location": "Unit 4\nLondon",
+                   "price": 40_000 + i, "property_type": "Apartment",
+                   "floor": i % 20}
+        elif i % 3 == 1:
+            yield {"kind": "house", "location": "Cape Town",
+                   "price": 250_000 + i, "property_type": "House",
+                   "bedrooms": 3, "garden_size": 120.5}
+        else:
+            yield {"kind": "commercial_with_parking", "location": "Durban",
+                   "price": 900_000, "property_type": "Office",
+                   "business_type": "Retail, \"flagship\"",
+                   "parking_slots": 12}
+
+
+def write_files(directory, count):
+    csv_path = os.path.join(directory, "listings.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, FIELDS)
+        writer.writeheader()
+        writer.writerows(make_rows(count))
+    jsonl_path = os.path.join(directory, "listings.jsonl")
+    with open(jsonl_path, "w", encoding="utf-8") as file:
+        for row in make_rows(count):
+            file.write(json.dumps(row) + "\n")
+    return csv_path, jsonl_path
+
+
+def check(path, count, **options):
+    listings = list(load_listings(path, **options))
+    if options.get("batch_size"):
+        listings = [listing for batch in listings for listing in batch]
+    assert len(listings) == count, (path, options, len(listings))
+    assert listings[0].location == "Unit 4\nLondon"
+    assert listings[0].price == 0  # Below MIN_PRICE, so clamped
+    assert listings[2].business_type == 'Retail, "flagship"'
+
+
+def check_bad_records(directory):
+    path = os.path.join(directory, "bad.jsonl")
+    rows = list(make_rows(6))
+    rows[1] = dict(rows[1], kind="castle")  # Unknown listing type
+    rows[4] = dict(rows[4], bedrooms="three")  # Not a number
+    with open(path, "w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row) + "\n")
+        file.write("{not json\n")
+
+    for workers in (None, 2):
+        errors = []
+        listings = list(load_listings(path, batch_size=2, workers=workers,
+                                      errors=errors))
+        assert [len(batch) for batch in listings] == [2, 2], listings
+        assert [index for index, _ in errors] == [1, 4, 6], errors
+    results = list(iter_listings(path))
+    assert [index for index, listing, _ in results if listing] == [0, 2, 3, 5]
+
+    loaded = []
+    try:
+        for listing in load_listings(path):  # No errors list: strict
+            loaded.append(listing)
+    except ValueError as e:
+        assert str(e).startswith("Record 1:"), e
+    else:
+        raise AssertionError("a bad record was silently skipped")
+    assert len(loaded) == 1
+    print("Bad records are reported per row; valid neighbours still load")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("empty.csv", "empty.jsonl"):
+            path = os.path.join(directory, name)
+            open(path, "w").close()
+            assert list(load_listings(path)) == []
+
+        csv_path, jsonl_path = write_files(directory, count)
+        # Small chunks so quoted line breaks straddle chunk boundaries
+        for path in (csv_path, jsonl_path):
+            for workers in (None, 2):
+                check(path, count, batch_size=7, workers=workers)
+        print("Empty files and quoted line breaks load correctly")
+        check_bad_records(directory)
+
+        for path in (csv_path, jsonl_path):
+            for workers in (None, 2, 4):
+                start = time.perf_counter()
+                for _ in load_listings(path, batch_size=5000, workers=workers):
+                    pass
+                rate = count / (time.perf_counter() - start)
+                print(f"{os.path.basename(path):<16}workers={workers or 1:<3}"
+                      f"{rate:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of summing values as Number objects (with sum() and with +=),
+as a NumberArray buffer, and as plain ints. Also checks the reflected
+NumberArray operators and that Number hashes like the value it equals.
+
+Run from the repository root:  python Checks/number_sum_benchmark.py [N]
+(N defaults to 10,000,000 values).
+"""
+import contextlib
+import io
+import os
+import runpy
+import sys
+import time
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "Examples", "ClassInheritance&MagicMethods.py")
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    example = runpy.run_path(EXAMPLE)
+Number = example["Number"]
+NumberArray = example["NumberArray"]
+
+
+def check_operators():
+    values = NumberArray([1, 2, 3])
+    assert list((2 * values).values) == [2, 4, 6]
+    assert list((1 + values).values) == [2, 3, 4]
+    assert list((10 - values).values) == [9, 8, 7]
+    assert list(sum([values, values]).values) == [2, 4, 6]
+    assert hash(Number(2)) == hash(2) and {Number(2): "a"}[2] == "a"
+    print("Reflected NumberArray operators and Number hashing work")
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {label:<28}{time.perf_counter() - start:>8.3f}s")
+    return result
+
+
+def main(count):
+    check_operators()
+    values = list(range(count))
+    numbers = [Number(value) for value in values]
+    buffered = NumberArray(values)
+    expected = count * (count - 1) // 2
+    print(f"Summing {count:,} values")
+
+    def accumulate():
+        total = Number(0)
+        for number in numbers:
+            total += number  # Updates total in place
+        return total
+
+    results = [
+        timed("sum() of Numbers", lambda: sum(numbers)),
+        timed("+= over Numbers", accumulate),
+        timed("NumberArray.sum()", buffered.sum),
+        timed("sum() of ints", lambda: Number(sum(values))),
+    ]
+    assert all(result == expected for result in results), \
+        [str(result) for result in results]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
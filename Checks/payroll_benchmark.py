@@ -0,0 +1,65 @@
+"""
+Benchmark of building a PayrollAggregator in bulk against adding the same
+employees one at a time, with checks that both give the same summary and
+that every group stays sorted.
+
+Run from the repository root:  python Checks/payroll_benchmark.py [N]
+(N defaults to 1,000,000 employees).
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    import TemplateEmployee as employees  # noqa: E402
+
+LANGUAGES = ("Python", "C++", "Go", "Rust", "Java")
+
+
+def make_staff(count):
+    rng = random.Random(42)
+    staff = []
+    for number in range(count):
+        salary = rng.randrange(30_000, 200_000)
+        if number % 3:
+            staff.append(employees.SlottedDeveloper(
+                f"Dev{number}", salary, "Developer",
+                LANGUAGES[number % len(LANGUAGES)]))
+        else:
+            staff.append(employees.SlottedManager(
+                f"Manager{number}", salary, "Manager", number % 10))
+    return staff
+
+
+def main(count):
+    staff = make_staff(count)
+    print(f"PayrollAggregator over {count:,} employees "
+          f"({'NumPy' if employees.np is not None else 'pure Python'} sort)")
+
+    start = time.perf_counter()
+    bulk = employees.PayrollAggregator(staff, by="language")
+    print(f"  bulk build          {time.perf_counter() - start:>8.3f}s")
+
+    start = time.perf_counter()
+    incremental = employees.PayrollAggregator(by="language")
+    for employee in staff:
+        incremental.add(employee)
+    print(f"  add() one by one    {time.perf_counter() - start:>8.3f}s")
+
+    assert bulk.summary() == incremental.summary()
+    for group in bulk.groups():
+        salaries = bulk._salaries[group]
+        assert all(a <= b for a, b in zip(salaries, salaries[1:]))
+        assert all(type(salary) is int for salary in salaries)
+    bulk.remove(staff[0])  # A manager, found by bisect after the bulk sort
+    assert bulk.count(None) == incremental.count(None) - 1
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,71 @@
+"""
+Throughput of the batch builders in method_override.py: records per second
+through create_people() for dict records, CSV rows and JSON Lines, with a
+check that null or numeric text fields are rejected rather than stringified.
+
+Run from the repository root:  python Checks/people_batch_benchmark.py [N]
+(N defaults to 1,000,000 records).
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from method_override import create_people  # noqa: E402
+
+COLORS = ("blue", "green", "brown", "hazel")
+HAIR = ("black", "blonde", "brown", "red")
+
+
+def check_rejects_non_text():
+    records = [{"name": None, "age": 30, "eye_color": "blue",
+                "hair_color": "red"},
+               '{"name": 123, "age": 30, "eye_color": "blue",'
+               ' "hair_color": "red"}',
+               ["Ann", "30", None, "red"],
+               ["Ann", "30", "blue", "red"]]
+    people, errors = create_people(records)
+    assert len(people) == 1 and [index for index, _ in errors] == [0, 1, 2], \
+        errors
+    print("Null and numeric names or colours are rejected")
+
+
+def make_dicts(count):
+    for number in range(count):
+        yield {"name": "Person", "age": number % 90,
+               "eye_color": COLORS[number % 4], "hair_color": HAIR[number % 4]}
+
+
+def make_rows(count):
+    for number in range(count):
+        yield ["Person", str(number % 90), COLORS[number % 4],
+               HAIR[number % 4]]
+
+
+def make_lines(count):
+    for record in make_dicts(count):
+        yield json.dumps(record)
+
+
+def main(count):
+    check_rejects_non_text()
+    print(f"create_people() on {count:,} records")
+    for label, records in (("dicts", make_dicts(count)),
+                           ("CSV rows", make_rows(count)),
+                           ("JSON Lines", make_lines(count))):
+        start = time.perf_counter()
+        people, errors = create_people(records)
+        seconds = time.perf_counter() - start
+        assert len(people) == count and not errors, errors[:3]
+        print(f"  {label:<12}{count / seconds:>12,.0f} records/s")
+        del people
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,88 @@
+"""
+Memory and query speed of PersonTable against a list of Person objects
+holding the same characters, plus checks that slicing a table returns a
+smaller table and that select() agrees with filtering the objects.
+
+Run from the repository root:  python Checks/person_table_benchmark.py [N]
+(N defaults to 1,000,000 characters).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from method_override import (DRIVING_AGE, PersonTable,  # noqa: E402
+                                 create_person, np)
+
+EYES = PersonTable.EYE_COLORS
+HAIR = PersonTable.HAIR_COLORS
+
+
+def make_rows(count):
+    for number in range(count):
+        yield (f"Person{number}", number % 90, EYES[number % len(EYES)],
+               HAIR[number % len(HAIR)])
+
+
+def measured(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def check_slices():
+    table = PersonTable()
+    for row in make_rows(10):
+        table.append(*row)
+    part = table[2:8:2]
+    assert isinstance(part, PersonTable) and len(part) == 3
+    assert [person.name for person in part.people()] == \
+        ["Person2", "Person4", "Person6"]
+    assert table[-1].name == "Person9"
+    print("Slicing a table returns a smaller table")
+
+
+def main(count):
+    check_slices()
+
+    def build_objects():
+        return [create_person(*row) for row in make_rows(count)]
+
+    def build_table():
+        table = PersonTable()
+        for row in make_rows(count):
+            table.append(*row)
+        return table
+
+    people, object_bytes = measured(build_objects)
+    table, table_bytes = measured(build_table)
+    print(f"Memory for {count:,} characters "
+          f"(select uses {'NumPy' if np is not None else 'pure Python'})")
+    print(f"  list of Person    {object_bytes / 2**20:>8.1f} MB")
+    print(f"  PersonTable       {table_bytes / 2**20:>8.1f} MB")
+
+    eye, hair = EYES[0], HAIR[0]
+    start = time.perf_counter()
+    expected = [row for row, person in enumerate(people)
+                if person.age >= DRIVING_AGE and person.eye_color == eye
+                and person.hair_color == hair]
+    scan = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = table.select(adult=True, eye_color=eye, hair_color=hair)
+    select = time.perf_counter() - start
+    assert rows == expected
+    print(f"Adults with {eye} eyes and {hair} hair ({len(rows):,} rows)")
+    print(f"  scan of Person objects   {scan:.3f}s")
+    print(f"  PersonTable.select()     {select:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
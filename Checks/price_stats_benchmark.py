@@ -0,0 +1,85 @@
+"""
+Benchmark of PriceTable.stats() at 1M listings against grouping the
+Property objects directly, with checks that both give the same counts,
+medians and percentiles and that any clamp threshold can be applied.
+
+Run from the repository root:  python Checks/price_stats_benchmark.py [N]
+(N defaults to 1,000,000 listings).
+"""
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from Property import (MIN_PRICE, Apartment, PriceTable,  # noqa: E402
+                          np)
+
+LOCATIONS = ["London", "Cape Town", "New York", "Durban", "Paris", "Lagos"]
+PERCENTILES = (25, 75, 90)
+
+
+def percentile(values, percent):
+    position = (len(values) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+# Group the objects' raw prices by location, one listing at a time.
+def object_stats(listings, threshold):
+    groups = {}
+    for listing in listings:
+        price = listing.raw_price
+        groups.setdefault(listing.location, []).append(
+            0.0 if price < threshold else price)
+    results = {}
+    for location, prices in groups.items():
+        prices.sort()
+        results[location] = dict(
+            count=len(prices), mean=sum(prices) / len(prices),
+            median=percentile(prices, 50),
+            **{f"p{percent}": percentile(prices, percent)
+               for percent in PERCENTILES})
+    return results
+
+
+def same(expected, actual):
+    assert expected.keys() == actual.keys()
+    for name, summary in expected.items():
+        assert summary.keys() == actual[name].keys()
+        for key, value in summary.items():
+            assert math.isclose(value, actual[name][key], rel_tol=1e-9), \
+                (name, key, value, actual[name][key])
+
+
+def main(count):
+    rng = random.Random(7)
+    listings = [Apartment(rng.choice(LOCATIONS), rng.randrange(0, 2_000_000),
+                          "Apartment", rng.randrange(20))
+                for _ in range(count)]
+    table = PriceTable.from_listings(listings)
+    assert PriceTable().stats() == {}
+    print(f"Price statistics by location, {count:,} listings "
+          f"({'NumPy' if np is not None else 'pure Python'})")
+
+    for threshold in (MIN_PRICE, 250_000):
+        start = time.perf_counter()
+        expected = object_stats(listings, threshold)
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = table.stats(threshold=threshold, percentiles=PERCENTILES)
+        columns = time.perf_counter() - start
+        same(expected, actual)
+        print(f"  threshold {threshold:>9,}   objects {scan:.3f}s"
+              f"   PriceTable.stats() {columns:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,106 @@
+"""
+Benchmark of PropertyIndex at 1M listings against scanning a list, plus
+checks that the index agrees with the scans and that a listing can still
+be removed after its price or attributes change.
+
+Run from the repository root:  python Checks/property_index_benchmark.py [N]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    from Property import Apartment, House, PropertyIndex  # noqa: E402
+
+LOCATIONS = ["London", "Cape Town", "New York", "Durban", "Paris", "Lagos"]
+QUERIES = 200
+
+
+def build_listings(count):
+    rng = random.Random(1)
+    listings = []
+    for i in range(count):
+        location = rng.choice(LOCATIONS)
+        price = rng.randrange(40_000, 2_000_000)
+        if i % 2:
+            listings.append(Apartment(location, price, "Apartment",
+                                      rng.randrange(20)))
+        else:
+            listings.append(House(location, price, "House",
+                                  rng.randrange(1, 6), rng.randrange(500)))
+    return listings
+
+
+def timed(label, function, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        function(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34}{elapsed / repeat * 1e3:>10.3f} ms/query")
+
+
+def check_changed_listing():
+    house = House("London", 300_000, "House", 3, 100)
+    index = PropertyIndex([house])
+    house.price, house.bedrooms, house.location = 60_000, 4, "Paris"
+    index.remove(house)  # Found under the values it was indexed with
+    assert len(index) == 0 and index.find(location="London") == []
+    index.add(house)
+    assert index.find(location="Paris", bedrooms=4) == [house]
+    try:
+        index.add(house)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("the same listing was indexed twice")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    check_changed_listing()
+
+    listings = build_listings(count)
+    start = time.perf_counter()
+    index = PropertyIndex(listings)
+    print(f"Indexed {count:,} listings in {time.perf_counter() - start:.1f}s")
+
+    # Index lookups and scans must agree
+    assert (sorted(map(id, index.price_range(100_000, 110_000))) ==
+            sorted(id(l) for l in listings if 100_000 <= l.price <= 110_000))
+    assert (sorted(map(id, index.find(location="Durban", bedrooms=2,
+                                      max_price=500_000))) ==
+            sorted(id(l) for l in listings if l.location == "Durban"
+                   and getattr(l, "bedrooms", None) == 2
+                   and l.price <= 500_000))
+
+    def low(i):
+        return 100_000 + i * 5_000
+
+    print("Index:")
+    timed("price_range(low, low + 10k)",
+          lambda i: index.price_range(low(i), low(i) + 10_000), QUERIES)
+    timed("find(location, bedrooms, max_price)",
+          lambda i: index.find(location=LOCATIONS[i % 6], bedrooms=i % 5 + 1,
+                               max_price=low(i)), QUERIES)
+    print("List scan:")
+    timed("price range", lambda i: [
+        l for l in listings if low(i) <= l.price <= low(i) + 10_000], 3)
+
+    print("Updates:")
+    start = time.perf_counter()
+    for listing in listings[:QUERIES]:
+        index.remove(listing)
+    for listing in listings[:QUERIES]:
+        index.add(listing)
+    elapsed = (time.perf_counter() - start) / (2 * QUERIES)
+    print(f"  {'remove() or add()':<34}{elapsed * 1e3:>10.3f} ms/update")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Memory and attribute-access speed of the slotted employee classes in
+TemplateEmployee.py against the dict-based ones, plus checks of how the
+two hierarchies differ (no __dict__, abstract roles, isinstance results).
+
+Run from the repository root:  python Checks/slotted_employee_benchmark.py [N]
+(N defaults to 1,000,000 instances of each class).
+"""
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    import TemplateEmployee as employees  # noqa: E402
+
+ARGS = {"name": "Carl", "salary": 120000, "position": "Team Lead",
+        "language": "C++", "team_size": 3, "responsibility": "Project Leader"}
+
+
+def check_hierarchy():
+    lead = employees.SlottedTeamLead(**ARGS)
+    assert not hasattr(lead, "__dict__")
+    assert isinstance(employees.TeamLead(**ARGS), employees.Manager)
+    assert isinstance(lead, (employees.ManagerRole, employees.DeveloperRole))
+    assert not isinstance(lead, employees.SlottedManager)
+    for role in (employees.ManagerRole, employees.DeveloperRole):
+        try:
+            role(**ARGS)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{role.__name__} was instantiated")
+    print("Slotted instances have no __dict__; role classes are abstract")
+
+
+def build(cls, count):
+    gc.collect()
+    tracemalloc.start()
+    staff = [cls(**ARGS) for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return staff, size
+
+
+def main(count):
+    check_hierarchy()
+    print(f"{count:,} instances of each class")
+    for cls in (employees.TeamLead, employees.SlottedTeamLead):
+        staff, size = build(cls, count)
+        start = time.perf_counter()
+        total = 0
+        for employee in staff:
+            total += employee.salary + employee.team_size
+        seconds = time.perf_counter() - start
+        assert total == count * (ARGS["salary"] + ARGS["team_size"])
+        print(f"  {cls.__name__:<18}{size / 2**20:>8.1f} MB   "
+              f"read 2 attributes {seconds / count * 1e9:>6.1f} ns/object")
+        del staff
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark: validations per second for the reusable validators in
+method_override.py compared with the original prompt-style checks.
+
+Run from the repository root:  python Checks/validator_benchmark.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Practical_Tasks"))
+
+from method_override import (AGE_VALIDATOR, EYE_COLOR_VALIDATOR,  # noqa: E402
+                             NAME_VALIDATOR, Person)
+
+N = 100_000
+REPEAT = 5
+
+NAMES = (["Alice", " Bob ", "R2D2", "Eve"] * N)[:N]
+AGES = (["42", "-1", "abc", " 7 "] * N)[:N]
+COLORS = (["blue", " Green ", "pink", "HAZEL"] * N)[:N]
+
+
+# The checks the original get_valid_* functions ran for every value,
+# including rebuilding the colour error message on every failure.
+def old_string(value):
+    value = value.strip()
+    if value.isalpha():
+        return value
+    message = "\nInvalid input. Please enter only letters."
+    return None
+
+
+def old_age(value):
+    try:
+        age = int(value)
+        if age < 0:
+            raise ValueError("\nAge cannot be negative.")
+        return age
+    except ValueError as e:
+        message = f"\nInvalid input: {e}"
+        return None
+
+
+def old_color(value, valid_colors=Person.VALID_EYE_COLORS):
+    value = value.strip().lower()
+    if value in valid_colors:
+        return value
+    message = f"""Invalid input: Please enter one of the following: {', '.join(
+        valid_colors)}."""
+    return None
+
+
+def rate(statement):
+    best = min(timeit.repeat(statement, number=1, repeat=REPEAT))
+    return N / best
+
+
+def main():
+    cases = [
+        ("name", old_string, NAME_VALIDATOR, NAMES),
+        ("age", old_age, AGE_VALIDATOR, AGES),
+        ("colour", old_color, EYE_COLOR_VALIDATOR, COLORS),
+    ]
+    print(f"{'check':<8}{'old (per s)':>16}{'new (per s)':>16}{'speed-up':>10}")
+    for label, old, validator, values in cases:
+        # Both paths must accept and clean the same values
+        expected = [old(value) for value in values]
+        assert validator.validate_all(values) == expected, label
+
+        old_rate = rate(lambda: [old(value) for value in values])
+        new_rate = rate(lambda: validator.validate_all(values))
+        print(f"{label:<8}{old_rate:>16,.0f}{new_rate:>16,.0f}"
+              f"{new_rate / old_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of writing a work() report for many employees: one work() call
+per object against the streamed iter_work_report()/write_work_report(),
+with a check that both produce the same text and that no suffix cache is
+kept between reports.
+
+Run from the repository root:  python Checks/work_report_benchmark.py [N]
+(N defaults to 1,000,000 employees).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "Examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):  # Skip the module's demo
+    import TemplateEmployee as employees  # noqa: E402
+
+POSITIONS = ("Developer", "Senior Developer", "Manager", "Team Lead")
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"  {label:<24}{time.perf_counter() - start:>8.3f}s")
+    return result
+
+
+def main(count):
+    staff = [employees.SlottedEmployee(f"Employee{number}", 50_000,
+                                       POSITIONS[number % len(POSITIONS)])
+             for number in range(count)]
+    print(f"work() report for {count:,} employees")
+
+    def per_object():
+        file = io.StringIO()
+        for employee in staff:
+            file.write(employee.work() + "\n")
+        return file.getvalue()
+
+    def streamed():
+        file = io.StringIO()
+        employees.write_work_report(staff, file)
+        return file.getvalue()
+
+    expected = timed("work() per object", per_object)
+    assert timed("write_work_report()", streamed) == expected
+
+    # Every report starts from an empty cache, so unique positions from
+    # one call are not kept alive by the module.
+    list(employees.iter_work_report(
+        employees.SlottedEmployee("A", 1, f"Role {number}")
+        for number in range(1000)))
+    assert not any(isinstance(value, dict) and len(value) >= 1000
+                   for value in vars(employees).values())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
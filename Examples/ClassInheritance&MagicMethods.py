@@ -1,6 +1,15 @@
 # Learning Objectives & Outcomes
 # Written by Gower Campbell
 
+from array import array, typecodes
+from collections import Counter
+from collections.abc import MutableSequence, Sequence
+from functools import total_ordering
+from itertools import repeat
+from numbers import Real
+import operator
+import sys
+
 # -----------------------------------------------------------------------------
 # Inheritance
 # -----------------------------------------------------------------------------
@@ -136,6 +145,203 @@ y = Number(30)
 result = x + y
 print(result)  # Output: 40
 
+# Example: The Full Numeric Protocol
+"""
+`__add__` always returns a new object. `__iadd__` lets `+=` update the object
+in place instead, `__radd__` handles `0 + Number` (which is how sum() starts),
+and `@total_ordering` fills in <=, > and >= from `__eq__` and `__lt__`.
+Each method returns NotImplemented for anything that is not a Number or a
+plain real number, so Python can try the other operand or raise TypeError
+(and `Number(1) == "1"` is simply False).
+`__hash__` is `hash(value)`, so a Number and the plain number it equals
+hash alike (`Number(2) == 2` and both find the same dict key).
+Note: `+=` now changes the object itself, so other names bound to the same
+Number see the new value too (and a Number used as a dict key must not be
+changed with `+=`, `-=` or `*=`, or it can no longer be found).
+"""
+@total_ordering
+class Number:
+    def __init__(self, value):
+        self.value = value
+
+    @staticmethod
+    def _value(other):
+        # Accept both Number objects and plain numbers
+        if isinstance(other, Number):
+            return other.value
+        if isinstance(other, Real):
+            return other
+        return NotImplemented
+
+    def __add__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(self.value + other)
+
+    def __radd__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(other + self.value)
+
+    def __iadd__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        self.value += other  # No new object is created
+        return self
+
+    def __sub__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(self.value - other)
+
+    def __rsub__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(other - self.value)
+
+    def __isub__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        self.value -= other
+        return self
+
+    def __mul__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(self.value * other)
+
+    def __rmul__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return Number(other * self.value)
+
+    def __imul__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        self.value *= other
+        return self
+
+    def __eq__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self.value == other
+
+    def __lt__(self, other):
+        other = self._value(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self.value < other
+
+    def __hash__(self):
+        return hash(self.value)  # Consistent with __eq__ on plain numbers
+
+    def __str__(self):
+        return str(self.value)
+
+# Usage
+numbers = [Number(10), Number(30), Number(2)]
+print(sum(numbers))  # Output: 42 (sum() still builds a new Number per item)
+total = Number(0)
+for number in numbers:
+    total += number  # Only += accumulates in place, with no temporary Numbers
+print(total, Number(10) * 3 - 5, Number(2) < Number(3))  # Output: 42 25 True
+print(Number(1) == "1")  # Output: False
+print(len({Number(2), 2, 2.0}))  # Output: 1
+
+# Example: A Container of Numbers Backed by One Buffer
+"""
+NumberArray keeps its values in a single `array.array` buffer instead of one
+Number object per value, and does element-wise arithmetic on the whole
+buffer at once. `+` builds a new buffer; `+=` updates the existing one.
+The reflected methods let a plain number come first (`2 * a`, `100 - a`),
+and `__radd__` also lets `sum()` start from 0.
+"""
+class NumberArray:
+    def __init__(self, values, typecode="d"):
+        self.values = array(typecode, values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return Number(self.values[index])
+
+    def _others(self, other):
+        # The values to combine with, element by element: another
+        # NumberArray (or any sequence of the same length), or a single
+        # number repeated. None if other is neither.
+        if isinstance(other, (NumberArray, list, tuple, array)):
+            if len(other) != len(self):
+                raise ValueError("NumberArrays must have the same length")
+            return other.values if isinstance(other, NumberArray) else other
+        scalar = Number._value(other)
+        if scalar is NotImplemented:
+            return None
+        return repeat(scalar, len(self))
+
+    def _combine(self, other, operation, reflected=False):
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        if reflected:  # other is the left operand, e.g. 100 - array
+            return NumberArray(map(operation, others, self.values),
+                               self.values.typecode)
+        return NumberArray(map(operation, self.values, others),
+                           self.values.typecode)
+
+    def __add__(self, other):
+        return self._combine(other, operator.add)
+
+    def __radd__(self, other):
+        return self._combine(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._combine(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._combine(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._combine(other, operator.mul, reflected=True)
+
+    def __iadd__(self, other):
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        values = self.values
+        for index, value in enumerate(others):
+            values[index] += value  # Written back into the same buffer
+        return self
+
+    def sum(self):
+        return Number(sum(self.values))  # Summed over the raw buffer
+
+    def __str__(self):
+        return str(list(self.values))
+
+# Usage
+prices = NumberArray([10, 30, 2])
+print(prices * 2 + 1)  # Output: [21.0, 61.0, 5.0]
+print(prices.sum())  # Output: 42.0
+buffer = prices.values
+prices += 1  # In place: prices.values is still the same array
+print(prices, prices.values is buffer)  # Output: [11.0, 31.0, 3.0] True
+print(2 * prices, 100 - prices)  # Output: [22.0, 62.0, 6.0] [89.0, 69.0, 97.0]
+print(sum([prices, prices]))  # Output: [22.0, 62.0, 6.0]
+
 # Example: Comparator Methods with `__gt__`
 class Student:
     def __init__(self, fullname, student_number, average):
@@ -212,7 +418,7 @@ class CustomContainer:
 # Usage
 container = CustomContainer(['apple', 'banana', 'orange'])
 container[1] = 'grape'  # Modify the item at index 1
-print(container[1])  # Output: grape
+print(container.items[1])  # Output: grape (this class has no __getitem__)
 
 # Example: `__contains__` for Membership Testing
 class CustomContainer:
@@ -249,6 +455,179 @@ container = CustomContainer(['apple', 'banana', 'orange'])
 for item in container:
     print(item)  # Output: apple, banana, orange
 
+# Example: A Complete Container
+"""
+The examples above each add one special method, and the iterator keeps its
+position on the container itself, so it can only be looped over once.
+Inheriting from `collections.abc.MutableSequence` and defining
+`__getitem__`, `__setitem__`, `__delitem__`, `__len__` and `insert` gives
+the full list-like protocol (append, pop, index, count, reversed, ...).
+Each loop gets its own lightweight iterator, slicing returns a view onto
+the same items instead of a copy, and an optional hash index makes `in`
+O(1) for large containers of hashable items.
+"""
+class ContainerIterator:
+    # Each loop has its own position, so loops never interfere
+    __slots__ = ("_items", "_index")
+
+    def __init__(self, items):
+        self._items = items
+        self._index = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._index >= len(self._items):
+            raise StopIteration
+        item = self._items[self._index]
+        self._index += 1
+        return item
+
+
+class ContainerView(Sequence):
+    # A read-only window onto a container's items; nothing is copied, so
+    # later changes to the container show through (like a memoryview).
+    # Only the slice is stored: its positions are worked out from the
+    # current length on every access, so the view follows inserts and
+    # deletes and never reads past the end.
+    def __init__(self, items, window):
+        self._items = items  # The items, or another view
+        self._window = window  # A slice of them
+
+    def _positions(self):
+        return range(len(self._items))[self._window]  # O(1), no copy
+
+    def __len__(self):
+        return len(self._positions())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ContainerView(self, index)
+        return self._items[self._positions()[index]]
+
+    def __repr__(self):
+        return f"ContainerView({list(self)!r})"
+
+
+class CustomContainer(MutableSequence):
+    def __init__(self, items=(), indexed=False, typecode=None):
+        if typecode is not None:
+            # Typed storage: raw numbers in one buffer, e.g. typecode "d"
+            self.items = array(typecode, items)
+        elif isinstance(items, (array, bytearray)):
+            self.items = items  # Mutable and resizable: shared, not copied
+        else:
+            self.items = self._copy_buffer(items)
+        # item -> number of copies, kept only when indexed=True
+        self._counts = Counter(self.items) if indexed else None
+
+    @staticmethod
+    def _copy_buffer(items):
+        # Other buffers (bytes, memoryview, NumPy arrays, ...) may be
+        # read-only or fixed in size, so their contents are copied into an
+        # array of the same type; anything else becomes a list (of rows,
+        # for a multi-dimensional buffer)
+        try:
+            view = memoryview(items)
+        except TypeError:
+            return list(items)
+        native = "@=" + ("<" if sys.byteorder == "little" else ">!")
+        with view:
+            typecode = view.format.lstrip(native)  # e.g. NumPy's "<d"
+            if (view.ndim == 1 and typecode in typecodes
+                    and array(typecode).itemsize == view.itemsize):
+                return array(typecode, view.tobytes())
+            if view.ndim > 1:
+                return view.tolist()
+        return list(items)
+
+    def _position(self, index):
+        # Allow negative indexes (as lists do), then check the bounds
+        if index < 0:
+            index += len(self.items)
+        if index < 0 or index >= len(self.items):
+            raise IndexError("Index out of range")
+        return index
+
+    def _count(self, item, change):
+        if self._counts is not None:
+            self._counts[item] += change
+            if not self._counts[item]:
+                del self._counts[item]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ContainerView(self.items, index)
+        return self.items[self._position(index)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            if isinstance(self.items, array) and not isinstance(value, array):
+                value = array(self.items.typecode, value)
+            self.items[index] = value
+            if self._counts is not None:
+                self._counts = Counter(self.items)
+            return
+        index = self._position(index)
+        old = self.items[index]
+        self.items[index] = value  # May raise, e.g. text in a typed array
+        self._count(old, -1)
+        self._count(self.items[index], +1)  # The value as stored
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            del self.items[index]
+            if self._counts is not None:
+                self._counts = Counter(self.items)
+            return
+        index = self._position(index)
+        self._count(self.items[index], -1)
+        del self.items[index]
+
+    def insert(self, index, value):
+        self.items.insert(index, value)
+        self._count(value, +1)
+
+    def __iter__(self):
+        return ContainerIterator(self.items)
+
+    def __contains__(self, item):
+        if self._counts is not None:
+            return item in self._counts  # O(1) hash lookup
+        return item in self.items  # Scans the list
+
+    def as_memoryview(self):
+        # Zero-copy access to typed storage, e.g. for numpy.frombuffer() or
+        # file.write(); raises TypeError for list storage
+        return memoryview(self.items)
+
+    def __buffer__(self, flags):
+        # Python 3.12+: lets memoryview(container) work directly
+        return memoryview(self.items)
+
+    def __repr__(self):
+        return f"CustomContainer({self.items!r})"
+
+# Usage
+container = CustomContainer(['apple', 'banana', 'orange'], indexed=True)
+container.append('grape')
+print([(a, b) for a in container for b in container][1])  # Output: ('apple', 'banana')
+print(container[1:3])  # Output: ContainerView(['banana', 'orange'])
+print('grape' in container, container.pop(), 'grape' in container)  # Output: True grape False
+
+# Typed storage: the same container over one array.array buffer of doubles.
+# It takes about a quarter of the memory, but iterating is a little slower,
+# because each value is boxed into a float as it is read.
+grades = CustomContainer(range(1000), typecode="d")
+boxed = CustomContainer([float(grade) for grade in range(1000)])
+print(sys.getsizeof(grades.items))  # About 8 KB: 8 bytes per grade
+print(sys.getsizeof(boxed.items) + sum(map(sys.getsizeof, boxed.items)))  # About 32 KB
+print(grades.as_memoryview().nbytes)  # Output: 8000 (no copy made)
+
 
 
 # -----------------------------------------------------------------------------
@@ -1,17 +1,422 @@
+import asyncio
+import hashlib
+import heapq
+import hmac
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice, repeat
+
+
 class LoginForm:
     def __init__(self, username, password):
         self.username = username
         self.password = password
 
+    def confirmation_text(self):
+        return f"\nWelcome, {self.username}!"
+
     def confirmation(self):
-        print(f"\nWelcome, {self.username}!")
+        print(self.confirmation_text())
 
 class RegisterForm(LoginForm):
     def __init__(self, username, password, email):
         super().__init__(username, password)
-        self.email = email24
+        self.email = email
+
+
+def hash_password(password, salt, iterations):
+    # Salted PBKDF2-SHA256; more iterations make each guess slower to try
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt,
+                               iterations)
+
+
+def take_password(form):
+    # Read a form's password and clear it, so the plaintext is not kept on
+    # the form once it has been hashed. Each form can be used only once.
+    password = form.password
+    if password is None:
+        raise ValueError("This form's password has already been used.")
+    form.password = None
+    return password
+
+
+class CredentialStore:
+    # Keeps only (salt, hash, iterations) per username in a dict, so
+    # lookups are O(1) and plaintext passwords are never stored. Each
+    # record keeps the iterations it was hashed with, so changing
+    # `iterations` only affects users registered afterwards.
+    def __init__(self, iterations=100_000, workers=4):
+        self.iterations = iterations
+        self._users = {}  # username -> (salt, password hash, iterations)
+        self._emails = set()
+        self._lock = threading.Lock()  # Guards _users and _emails together
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+    def __len__(self):
+        return len(self._users)
+
+    def __contains__(self, username):
+        return username in self._users
+
+    def has_email(self, email):
+        return email in self._emails
+
+    def register(self, form):
+        email = getattr(form, "email", None)  # Only RegisterForm has one
+        self._check_free(form.username, email)  # Fail before the slow hash
+        salt = os.urandom(16)
+        self.add_hashed(form.username, salt,
+                        hash_password(take_password(form), salt,
+                                      self.iterations),
+                        email)
+
+    def _check_free(self, username, email):
+        if username in self._users:
+            raise ValueError(f"Username {username!r} is already taken.")
+        if email is not None and email in self._emails:
+            raise ValueError(f"Email {email!r} is already registered.")
+
+    # Store an already salted and hashed password (used by bulk_register).
+    def add_hashed(self, username, salt, password_hash, email=None,
+                   iterations=None):
+        if iterations is None:
+            iterations = self.iterations
+        # Hashing runs without the GIL, so two threads can register the
+        # same name or email at once; only the first to get here succeeds.
+        with self._lock:
+            self._check_free(username, email)
+            self._users[username] = (salt, password_hash, iterations)
+            if email is not None:
+                self._emails.add(email)
+
+    def verify(self, form):
+        return self._verify(form.username, take_password(form))
+
+    def _verify(self, username, password):
+        record = self._users.get(username)
+        if record is None:
+            # Hash anyway so unknown usernames take as long as known ones
+            hash_password(password, b"\0" * 16, self.iterations)
+            return False
+        salt, expected, iterations = record
+        actual = hash_password(password, salt, iterations)
+        return hmac.compare_digest(actual, expected)
+
+    # Verify on the thread pool; returns a Future so callers are not
+    # blocked while the (deliberately slow) hash runs.
+    def login(self, form):
+        return self._pool.submit(self._verify, form.username,
+                                 take_password(form))
+
+    def close(self):
+        self._pool.shutdown()
+
+
+class LoginService:
+    # Asyncio front end for a CredentialStore. Hashing runs off the event
+    # loop, at most max_concurrent hashes run at a time, and identical
+    # logins that arrive while one is being checked share its result.
+    def __init__(self, store, max_concurrent=4):
+        self.store = store
+        self._limit = asyncio.Semaphore(max_concurrent)
+        self._in_flight = {}  # (username, password HMAC) -> Task
+        self._key = secrets.token_bytes(32)  # Per-service HMAC key
+
+    async def register(self, form):
+        async with self._limit:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.store.register, form)
+        return form.confirmation_text()
+
+    # Returns the confirmation text, or None if the login is rejected.
+    async def login(self, form):
+        password = take_password(form)
+        # Key on a keyed HMAC so neither the plaintext nor a plain hash of
+        # the password (which could be looked up offline) is kept as a key
+        key = (form.username, hmac.new(self._key, password.encode("utf-8"),
+                                       hashlib.sha256).digest())
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._verify(form.username, password))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        verified = await asyncio.shield(task)  # One caller cancelling is fine
+        return form.confirmation_text() if verified else None
+
+    async def _verify(self, username, password):
+        async with self._limit:
+            return await asyncio.wrap_future(
+                self.store.login(LoginForm(username, password)))
+
+
+class SessionCache:
+    # Opaque session tokens mapped to usernames. Entries expire after `ttl`
+    # seconds, and when more than `max_size` are held the least recently
+    # used one is evicted. Validating a token is a dict lookup; passwords
+    # are only hashed once, at login.
+    def __init__(self, max_size=10_000, ttl=3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._sessions = OrderedDict()  # token -> (username, expires at)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self._lookup_seconds = 0.0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    # Check the password once and return a new token, or None.
+    def login(self, store, form):
+        if not store.verify(form):
+            return None
+        return self.issue(form.username)
+
+    def issue(self, username):
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._sessions[token] = (username, time.monotonic() + self.ttl)
+            while len(self._sessions) > self.max_size:
+                self._sessions.popitem(last=False)  # Least recently used
+                self.evictions += 1
+        return token
 
+    # Return the token's username, or None if it is unknown or expired.
+    def validate(self, token):
+        start = time.perf_counter()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is not None and session[1] <= time.monotonic():
+                del self._sessions[token]  # Expired
+                self.evictions += 1
+                session = None
+            if session is None:
+                self.misses += 1
+            else:
+                self._sessions.move_to_end(token)  # Most recently used
+                self.hits += 1
+            self._lookup_seconds += time.perf_counter() - start
+        return None if session is None else session[0]
 
-new_user = LoginForm(username: 'admin', password: 'password')
+    def revoke(self, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"sessions": len(self), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "mean_lookup_us": (self._lookup_seconds / lookups * 1e6
+                                   if lookups else 0.0)}
+
+
+# A SharedSessionCache statistic kept in the manager, so every process
+# updates and reads the same counter.
+class _SharedCounter:
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._counters[self.name]
+
+    def __set__(self, instance, value):
+        instance._counters[self.name] = value
+
+
+class SharedSessionCache(SessionCache):
+    # Same interface, but sessions and statistics live in a
+    # multiprocessing.Manager, so worker processes on one host share them.
+    # Create one cache (e.g. SharedSessionCache(multiprocessing.Manager()))
+    # and pass it to the workers. A Manager dict has no ordering, so each
+    # entry records when it was last used, and a full cache is purged in
+    # one sweep: see _purge().
+    hits = _SharedCounter()
+    misses = _SharedCounter()
+    evictions = _SharedCounter()
+    _lookup_seconds = _SharedCounter()
+
+    def __init__(self, manager, max_size=10_000, ttl=3600):
+        self._counters = manager.dict()  # Needed by the counters below
+        super().__init__(max_size, ttl)
+        self._sessions = manager.dict()  # token -> (username, expires, used)
+        self._lock = manager.Lock()
+
+    def issue(self, username):
+        token = secrets.token_urlsafe(32)
+        now = time.monotonic()
+        with self._lock:
+            if len(self._sessions) >= self.max_size:
+                self._purge(now)
+            self._sessions[token] = (username, now + self.ttl, now)
+        return token
+
+    # Drop every expired session, then, if that frees less than a tenth of
+    # the cache, the least recently used ones up to that tenth. Copying
+    # the dict out of the manager is the slow part, so it is done at most
+    # once per max_size // 10 logins rather than on every login.
+    def _purge(self, now):
+        sessions = self._sessions.copy()
+        keep = self.max_size - max(1, self.max_size // 10)
+        expired = [token for token, session in sessions.items()
+                   if session[1] <= now]
+        alive = len(sessions) - len(expired)
+        oldest = []
+        if alive > keep:
+            live = ((session[2], token) for token, session in sessions.items()
+                    if session[1] > now)
+            oldest = [token for _, token in heapq.nsmallest(alive - keep, live)]
+        for token in expired + oldest:
+            self._sessions.pop(token, None)
+        self.evictions += len(expired) + len(oldest)
+
+    def validate(self, token):
+        start = time.perf_counter()
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is not None and session[1] <= now:
+                del self._sessions[token]  # Expired
+                self.evictions += 1
+                session = None
+            if session is None:
+                self.misses += 1
+            else:
+                self._sessions[token] = (session[0], session[1], now)
+                self.hits += 1
+            self._lookup_seconds += time.perf_counter() - start
+        return None if session is None else session[0]
+
+
+def bulk_register(store, records, batch_size=10_000, processes=None):
+    # Register many (username, password, email) records or RegisterForms.
+    # Each record is checked against the store's username and email hash
+    # indexes (O(1) each) and against the rest of its batch; passwords are
+    # hashed across a process pool; accepted users are committed to the
+    # store one batch at a time.
+    started = time.perf_counter()
+    registered = duplicates = 0
+    records = iter(records)
+    # processes=1 hashes in this process (no pool to start or fork)
+    pool = None if processes == 1 else ProcessPoolExecutor(processes)
+    try:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            accepted = []
+            batch_usernames = set()  # Exact check within this batch
+            batch_emails = set()
+            for record in batch:
+                if not isinstance(record, RegisterForm):
+                    record = RegisterForm(*record)
+                username, email = record.username, record.email
+                if (username in store or username in batch_usernames
+                        or store.has_email(email) or email in batch_emails):
+                    duplicates += 1
+                    continue
+                batch_usernames.add(username)
+                batch_emails.add(email)
+                accepted.append(record)
+
+            salts = [os.urandom(16) for _ in accepted]
+            passwords = [take_password(form) for form in accepted]
+            if pool is None:
+                hashes = map(hash_password, passwords, salts,
+                             repeat(store.iterations))
+            else:
+                hashes = pool.map(hash_password, passwords, salts,
+                                  repeat(store.iterations),
+                                  chunksize=max(1, len(accepted) // 64))
+            for form, salt, password_hash in zip(accepted, salts, hashes):
+                try:
+                    store.add_hashed(form.username, salt, password_hash,
+                                     form.email, store.iterations)
+                except ValueError:  # Registered elsewhere while hashing
+                    duplicates += 1
+                else:
+                    registered += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    seconds = time.perf_counter() - started
+    report = {"registered": registered, "duplicates": duplicates,
+              "seconds": seconds,
+              "records_per_second": (registered + duplicates) / seconds}
+    try:
+        import resource  # Unix only
+    except ImportError:
+        pass
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":  # macOS reports bytes, Linux kilobytes
+            peak //= 1024
+        report["peak_memory_kb"] = peak
+    return report
+
+
+# Simulate `clients` concurrent logins and report p50/p99 latency in ms.
+async def load_test(service, clients, users=100):
+    forms = [LoginForm(f"user{number % users}", "password")
+             for number in range(clients)]
+    latencies = []
+
+    async def client(form):
+        start = time.perf_counter()
+        await service.login(form)
+        latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client(form) for form in forms))
+    latencies.sort()
+    return {"clients": clients,
+            "p50_ms": latencies[len(latencies) // 2] * 1000,
+            "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000}
+
+
+def run_load_tests(levels=(1_000, 10_000, 50_000), users=100, iterations=1000):
+    store = CredentialStore(iterations=iterations)
+    for number in range(users):
+        store.register(RegisterForm(f"user{number}", "password",
+                                    f"user{number}@example.com"))
+
+    async def run_levels():
+        service = LoginService(store)  # One service (and loop) for all levels
+        for clients in levels:
+            print(await load_test(service, clients, users))
+
+    asyncio.run(run_levels())
+    store.close()
+
+
+new_user = LoginForm(username='admin', password='password')
 new_user.confirmation()
 
+# Each form's password is cleared once it has been hashed, so every
+# register or login below gets a fresh form.
+store = CredentialStore(iterations=1000)
+store.register(RegisterForm('admin', 'password', 'admin@example.com'))
+login_form = LoginForm('admin', 'password')
+if store.login(login_form).result():  # Verified on the thread pool
+    login_form.confirmation()
+print(login_form.password)  # Output: None
+
+service = LoginService(store)
+print(asyncio.run(service.login(LoginForm('admin', 'password'))))  # Output: Welcome, admin!
+
+sessions = SessionCache(max_size=1000, ttl=600)
+token = sessions.login(store, LoginForm('admin', 'password'))  # Hashes the password once
+print(sessions.validate(token))  # Output: admin (no hashing)
+
+report = bulk_register(store, [("bob", "secret", "bob@example.com"),
+                               ("admin", "other", "new@example.com"),
+                               ("carol", "secret", "bob@example.com")],
+                       processes=1)
+print(report["registered"], report["duplicates"])  # Output: 1 2
+store.close()
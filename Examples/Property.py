@@ -1,13 +1,48 @@
+from array import array
+import bisect
+import csv
+import json
+import mmap
+import os
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np  # Optional: vectorised PriceTable statistics
+except ImportError:
+    np = None
+
+
+MIN_PRICE = 50000  # Prices below this are recorded as 0
+
+
 class Property:
     def __init__(self, location, price, property_type):
-        # Initialize property attributes
-        self.location = location
-        if price < 50000:  # Ensure price is at least 50,000
-            price = 0
-        self.price = price
-        self.property_type = property_type
+        # Initialize property attributes. A new object has no cached text,
+        # so these are stored directly rather than through __setattr__.
+        self.__dict__.update(
+            location=location,
+            price=0 if price < MIN_PRICE else price,  # At least 50,000
+            raw_price=price,  # The price as listed, before the clamp
+            property_type=property_type)
+
+    def __setattr__(self, name, value):
+        # Any attribute change (e.g. price or floor) makes the cached text stale
+        self.__dict__.pop("_description", None)
+        super().__setattr__(name, value)
+        if name == "price":  # A price set later is not clamped, so it is raw
+            super().__setattr__("raw_price", value)
 
     def __str__(self):
+        # Build the description once and reuse it until an attribute changes
+        description = self.__dict__.get("_description")
+        if description is None:
+            description = self.__dict__["_description"] = self._describe()
+        return description
+
+    def _describe(self):
         # Return a formatted string representation of the property
         return f"This {self.property_type} is located at: {self.location}, and costs {self.price} USD"
 
@@ -17,9 +52,9 @@ class Apartment(Property):
         super().__init__(location, price, property_type)
         self.floor = floor  # Additional attribute for apartments
 
-    def __str__(self):
+    def _describe(self):
         # Extend the string representation to include the floor
-        return super().__str__() + f". It is located on floor {self.floor}"
+        return super()._describe() + f". It is located on floor {self.floor}"
 
 class House(Property):
     def __init__(self, location, price, property_type, bedrooms, garden_size):
@@ -28,9 +63,9 @@ class House(Property):
         self.bedrooms = bedrooms  # Additional attribute for houses
         self.garden_size = garden_size
 
-    def __str__(self):
+    def _describe(self):
         # Extend the string representation to include the number of bedrooms and garden size
-        return super().__str__() + f".\n It has {self.bedrooms} bedrooms and a garden with size {self.garden_size} sq.m."
+        return super()._describe() + f".\n It has {self.bedrooms} bedrooms and a garden with size {self.garden_size} sq.m."
 
 class CommercialSpace(Property):
     def __init__(self, location, price, property_type, business_type):
@@ -38,9 +73,9 @@ class CommercialSpace(Property):
         super().__init__(location, price, property_type)
         self.business_type = business_type  # Additional attribute for commercial spaces
 
-    def __str__(self):
+    def _describe(self):
         # Extend the string representation to include the business type
-        return super().__str__() + f". It is suitable for {self.business_type}."
+        return super()._describe() + f". It is suitable for {self.business_type}."
 
 class Parking:
     def __init__(self, parking_slots):
@@ -55,9 +90,445 @@ class CommercialWithParking(CommercialSpace, Parking):
         CommercialSpace.__init__(self, location, price, property_type, business_type)
         Parking.__init__(self, parking_slots)
 
-    def __str__(self):
+    def _describe(self):
         # Combine the string representations from both CommercialSpace and Parking
-        return CommercialSpace.__str__(self) + " " + Parking.__str__(self)
+        return CommercialSpace._describe(self) + " " + Parking.__str__(self)
+
+def _number(value):
+    # Parse "250" as 250 and "12.5" as 12.5; numbers from JSON pass through
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return value
+
+
+# Maps a listing's type column to its class and the extra fields it needs
+LISTING_TYPES = {
+    "apartment": (Apartment, (("floor", int),)),
+    "house": (House, (("bedrooms", int), ("garden_size", _number))),
+    "commercial": (CommercialSpace, (("business_type", str),)),
+    "commercial_with_parking": (CommercialWithParking,
+                                (("business_type", str),
+                                 ("parking_slots", int))),
+}
+
+
+def build_listing(row, type_column="kind"):
+    # Create the right Property subclass for one row (a dict of field values).
+    # The constructor applies the usual price < 50,000 -> 0 rule.
+    kind = row[type_column].strip().lower()
+    if kind not in LISTING_TYPES:
+        raise ValueError(f"Unknown listing type: {kind}")
+    listing_class, extra_fields = LISTING_TYPES[kind]
+    extras = [parse(row[field]) for field, parse in extra_fields]
+    return listing_class(row["location"], _number(row["price"]),
+                         row["property_type"], *extras)
+
+
+def _parse_records(records, header, type_column, start=0):
+    # Turn CSV rows (lists of fields, when header is given) or raw JSON
+    # Lines text into (index, listing, error) tuples, numbering the records
+    # from start. A bad record only loses itself, never the whole chunk.
+    results = []
+    for index, record in enumerate(records, start):
+        try:
+            if header is None:
+                if not record.strip():  # Blank line
+                    continue
+                row = json.loads(record)
+            else:
+                if not record:  # Blank line
+                    continue
+                row = dict(zip(header, record))
+            results.append((index, build_listing(row, type_column), None))
+        except KeyError as e:
+            results.append((index, None, f"Missing field: {e.args[0]}"))
+        except (TypeError, ValueError) as e:
+            results.append((index, None, str(e)))
+    return results
+
+
+def iter_listings(path, type_column="kind", workers=None, chunk_size=1000):
+    # Stream (index, listing, error) tuples from a .csv file (with a header
+    # row) or a JSON Lines file, where index counts the records after any
+    # header and exactly one of listing and error is None.
+    # With workers > 1, chunks of records are parsed in separate processes,
+    # with only a few chunks in flight at once so memory stays bounded.
+    # CSV is split into records by csv.reader before chunking, so quoted
+    # fields may contain line breaks on both paths.
+    with open(path, newline="", encoding="utf-8") as file:
+        header = None
+        records = file  # JSON Lines: one record per line
+        if path.lower().endswith(".csv"):
+            records = csv.reader(file)
+            header = next(records, None)
+            if header is None:  # Empty file
+                return
+
+        start = 0
+        if workers and workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                pending = deque()
+                while True:
+                    chunk = list(islice(records, chunk_size))
+                    if chunk:
+                        pending.append(pool.submit(
+                            _parse_records, chunk, header, type_column, start))
+                        start += len(chunk)
+                    if pending and (not chunk or len(pending) >= 2 * workers):
+                        yield from pending.popleft().result()
+                    elif not chunk:
+                        return
+        else:
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    return
+                yield from _parse_records(chunk, header, type_column, start)
+                start += len(chunk)
+
+
+def load_listings(path, type_column="kind", batch_size=None, workers=None,
+                  errors=None):
+    # Stream listings from a .csv or JSON Lines file (see iter_listings).
+    # Yields one listing at a time, or lists of batch_size listings.
+    # Bad records are skipped and added to errors as (index, message) when
+    # an errors list is given; otherwise the first one raises ValueError,
+    # after every listing before it has been yielded.
+    batch = []
+    for index, listing, error in iter_listings(path, type_column, workers,
+                                               batch_size or 1000):
+        if error is not None:
+            if errors is None:
+                raise ValueError(f"Record {index}: {error}")
+            errors.append((index, error))
+        elif batch_size:
+            batch.append(listing)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        else:
+            yield listing
+    if batch:
+        yield batch
+
+
+def _percentile(sorted_values, percent):
+    # Percentile (0-100) with linear interpolation between sorted values
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class PriceTable:
+    # Column store of listing prices for market statistics. Raw prices are
+    # kept in a typed array, and location/property_type as small integer
+    # codes, so the price clamp can be re-applied with any threshold.
+    def __init__(self):
+        self.prices = array("d")  # Raw, unclamped prices
+        self.location_codes = array("I")
+        self.type_codes = array("I")
+        self.locations = []  # code -> location
+        self.property_types = []  # code -> property_type
+        self._location_codes = {}
+        self._type_codes = {}
+
+    @classmethod
+    def from_listings(cls, listings):
+        # Uses each listing's raw (unclamped) price, so any threshold works
+        table = cls()
+        for listing in listings:
+            table.add(listing.location, listing.property_type,
+                      listing.raw_price)
+        return table
+
+    def __len__(self):
+        return len(self.prices)
+
+    @staticmethod
+    def _code(value, codes, values):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def add(self, location, property_type, price):
+        location_code = self._code(location, self._location_codes,
+                                   self.locations)
+        type_code = self._code(property_type, self._type_codes,
+                               self.property_types)
+        self.prices.append(price)
+        self.location_codes.append(location_code)
+        self.type_codes.append(type_code)
+
+    def clamped_prices(self, threshold=MIN_PRICE):
+        # The Property.__init__ rule applied to every price at once
+        return array("d", [0.0 if price < threshold else price
+                           for price in self.prices])
+
+    def stats(self, by="location", threshold=MIN_PRICE,
+              percentiles=(25, 75, 90)):
+        # Mean, median and percentiles of clamped prices per location or
+        # property_type, grouped in a single pass over the columns. Uses
+        # NumPy when it is installed (means may differ in the last digits).
+        if by == "location":
+            codes, names = self.location_codes, self.locations
+        elif by == "property_type":
+            codes, names = self.type_codes, self.property_types
+        else:
+            raise ValueError("by must be 'location' or 'property_type'.")
+        if np is not None:
+            return self._stats_numpy(codes, names, threshold, percentiles)
+
+        groups = [[] for _ in names]
+        for code, price in zip(codes, self.prices):
+            groups[code].append(0.0 if price < threshold else price)
+
+        results = {}
+        for name, prices in zip(names, groups):
+            if not prices:
+                continue
+            prices.sort()
+            summary = {"count": len(prices), "mean": sum(prices) / len(prices),
+                       "median": _percentile(prices, 50)}
+            for percent in percentiles:
+                summary[f"p{percent}"] = _percentile(prices, percent)
+            results[name] = summary
+        return results
+
+    def _stats_numpy(self, codes, names, threshold, percentiles):
+        # Sort by (group code, clamped price) once, then each group is a
+        # sorted slice. The columns are viewed in place, not copied.
+        if not len(self):
+            return {}
+        prices = np.frombuffer(self.prices, dtype=np.float64)
+        codes = np.frombuffer(codes, dtype=f"u{codes.itemsize}")
+        prices = np.where(prices < threshold, 0.0, prices)
+        order = np.lexsort((prices, codes))
+        prices = prices[order]
+        ends = np.cumsum(np.bincount(codes, minlength=len(names))).tolist()
+
+        results = {}
+        start = 0
+        for name, end in zip(names, ends):
+            group, start = prices[start:end], end
+            if not len(group):
+                continue
+            summary = {"count": len(group), "mean": float(group.mean()),
+                       "median": float(_percentile(group, 50))}
+            for percent in percentiles:
+                summary[f"p{percent}"] = float(_percentile(group, percent))
+            results[name] = summary
+        return results
+
+
+# Fixed-width binary catalog format (little-endian):
+#   header:  magic, record count, offset of the string table
+#   records: type tag, listed (raw) price, floor, bedrooms, garden_size,
+#            parking_slots, and string-table offsets for location,
+#            property_type and business_type (NO_STRING when the field
+#            does not apply)
+#   strings: each distinct string once, as a length followed by UTF-8 bytes
+CATALOG_MAGIC = b"PROP"
+CATALOG_HEADER = struct.Struct("<4sIQ")
+CATALOG_RECORD = struct.Struct("<BdiidiIII")
+NO_STRING = 0xFFFFFFFF
+CATALOG_TAGS = {Apartment: 1, House: 2, CommercialSpace: 3,
+                CommercialWithParking: 4}
+
+
+def write_catalog(path, listings):
+    # Write listings to a binary catalog that ListingCatalog can open
+    strings = bytearray()
+    string_offsets = {}
+
+    def string_offset(value):
+        if value is None:
+            return NO_STRING
+        offset = string_offsets.get(value)
+        if offset is None:
+            offset = string_offsets[value] = len(strings)
+            encoded = value.encode("utf-8")
+            strings.extend(struct.pack("<I", len(encoded)) + encoded)
+        return offset
+
+    count = 0
+    with open(path, "wb") as file:
+        file.write(CATALOG_HEADER.pack(CATALOG_MAGIC, 0, 0))  # Patched below
+        for listing in listings:
+            file.write(CATALOG_RECORD.pack(
+                CATALOG_TAGS[type(listing)], listing.raw_price,
+                getattr(listing, "floor", 0),
+                getattr(listing, "bedrooms", 0),
+                getattr(listing, "garden_size", 0),
+                getattr(listing, "parking_slots", 0),
+                string_offset(listing.location),
+                string_offset(listing.property_type),
+                string_offset(getattr(listing, "business_type", None))))
+            count += 1
+        strings_start = file.tell()
+        file.write(strings)
+        file.seek(0)
+        file.write(CATALOG_HEADER.pack(CATALOG_MAGIC, count, strings_start))
+
+
+def _whole(number):
+    # Doubles such as 250.0 come back as 250, like the values written
+    return int(number) if number.is_integer() else number
+
+
+class ListingCatalog:
+    # Read-only view of a binary catalog. The file is memory-mapped, so
+    # opening only reads the header; a listing object is built only when
+    # it is accessed.
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            # mmap cannot map an empty file, so check the size first
+            if os.fstat(file.fileno()).st_size < CATALOG_HEADER.size:
+                raise ValueError(f"{path} is not a listing catalog.")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._strings_start = \
+            CATALOG_HEADER.unpack_from(self._map)
+        if magic != CATALOG_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a listing catalog.")
+
+    def __len__(self):
+        return self._count
+
+    def _string(self, offset):
+        if offset == NO_STRING:
+            return None
+        start = self._strings_start + offset
+        (length,) = struct.unpack_from("<I", self._map, start)
+        return self._map[start + 4:start + 4 + length].decode("utf-8")
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Listing index out of range")
+        (tag, price, floor, bedrooms, garden_size, parking_slots,
+         location, property_type, business_type) = CATALOG_RECORD.unpack_from(
+            self._map, CATALOG_HEADER.size + index * CATALOG_RECORD.size)
+        common = (self._string(location), _whole(price),
+                  self._string(property_type))
+        if tag == 1:
+            return Apartment(*common, floor)
+        if tag == 2:
+            return House(*common, bedrooms, _whole(garden_size))
+        if tag == 3:
+            return CommercialSpace(*common, self._string(business_type))
+        return CommercialWithParking(*common, self._string(business_type),
+                                     parking_slots)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def render_feed(listings):
+    # Render a whole listing feed with a single join of the cached descriptions
+    return "\n".join(map(str, listings))
+
+
+class PropertyIndex:
+    # Attributes with a hash index: value -> {listing number: listing}
+    INDEXED_ATTRIBUTES = ("location", "property_type", "bedrooms", "floor",
+                          "parking_slots")
+
+    def __init__(self, listings=()):
+        self._by_price = []  # Sorted (price, listing number) pairs
+        self._listings = {}  # listing number -> listing
+        self._numbers = {}  # id(listing) -> listing number
+        self._indexed = {}  # listing number -> (price, {attribute: value})
+        self._next_number = 0
+        self._indexes = {name: {} for name in self.INDEXED_ATTRIBUTES}
+        # Collect the initial listings and sort them once
+        for listing in listings:
+            self._by_price.append(self._track(listing))
+        self._by_price.sort()
+
+    def __len__(self):
+        return len(self._listings)
+
+    def add(self, listing):
+        bisect.insort(self._by_price, self._track(listing))
+
+    # Index a new listing under the values it has now and remember those
+    # values, so remove() still finds it after its attributes change.
+    # Returns the (price, listing number) pair for the price list.
+    def _track(self, listing):
+        if id(listing) in self._numbers:
+            raise ValueError("This listing is already in the index.")
+        number = self._next_number
+        self._next_number += 1
+        self._listings[number] = listing
+        self._numbers[id(listing)] = number
+        values = {}
+        for name, index in self._indexes.items():
+            if hasattr(listing, name):  # e.g. only houses have bedrooms
+                value = values[name] = getattr(listing, name)
+                index.setdefault(value, {})[number] = listing
+        self._indexed[number] = (listing.price, values)
+        return listing.price, number
+
+    # A listing can be removed with the values it was indexed under even
+    # if its price or attributes have changed since; remove() and add() it
+    # again to index the new values.
+    def remove(self, listing):
+        number = self._numbers.pop(id(listing))
+        del self._listings[number]
+        price, values = self._indexed.pop(number)
+        position = bisect.bisect_left(self._by_price, (price, number))
+        del self._by_price[position]
+        for name, value in values.items():
+            bucket = self._indexes[name][value]
+            del bucket[number]
+            if not bucket:
+                del self._indexes[name][value]
+
+    def price_range(self, low, high):
+        # Binary search for both ends, then read off the k matches
+        start = bisect.bisect_left(self._by_price, (low, -1))
+        end = bisect.bisect_right(self._by_price, (high, float("inf")))
+        return [self._listings[number]
+                for _, number in self._by_price[start:end]]
+
+    def find(self, min_price=None, max_price=None, **criteria):
+        # e.g. find(location="London", bedrooms=3, max_price=200000)
+        for name in criteria:
+            if name not in self._indexes:
+                raise ValueError(f"{name} is not an indexed attribute.")
+        buckets = sorted((self._indexes[name].get(value, {})
+                          for name, value in criteria.items()), key=len)
+        if not buckets:
+            low = float("-inf") if min_price is None else min_price
+            high = float("inf") if max_price is None else max_price
+            return self.price_range(low, high)
+
+        smallest, rest = buckets[0], buckets[1:]  # Start from the rarest
+        indexed = self._indexed
+        return [listing for number, listing in smallest.items()
+                if all(number in bucket for bucket in rest)
+                and (min_price is None or indexed[number][0] >= min_price)
+                and (max_price is None or indexed[number][0] <= max_price)]
+
 
 # Creating instances of Apartment, House, and CommercialSpace
 prop_1 = Apartment("London", 12345678, "Apartment", 5)
@@ -69,8 +540,12 @@ print(apartment)  # Prints details of another apartment
 house_1 = House("Capetown", 123300, "House", 3, 250)
 print(house_1)  # Prints details of the house
 
-commercial _space_1 = CommercialSpace("New York", 500000, "Commercial Space", "Retail Store")
+commercial_space_1 = CommercialSpace("New York", 500000, "Commercial Space", "Retail Store")
 print(commercial_space_1)  # Prints details of the commercial space
 
 commercial_parking = CommercialWithParking("Johannesburg", 700000, "Office", "Corporate Office", 50)
 print(commercial_parking)  # Prints details of the commercial space with parking
+
+index = PropertyIndex([prop_1, apartment, house_1, commercial_space_1, commercial_parking])
+print(len(index.price_range(100000, 600000)))  # Output: 3
+print(index.find(property_type="Apartment", max_price=200000)[0])  # Prints the Downtown apartment
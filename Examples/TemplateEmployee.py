@@ -1,5 +1,19 @@
+import bisect
+import sys
+from abc import ABCMeta, abstractmethod
+
+try:
+    import numpy as np  # Optional: faster sorting for large payrolls
+except ImportError:
+    np = None
+
+
+# Every __init__ below is cooperative: it takes the arguments it needs,
+# passes the rest on with super().__init__(**kwargs), and so each class in
+# the MRO (TeamLead -> Manager -> Developer -> TemplateEmployee) runs once.
 class TemplateEmployee:
-    def __init__(self, name, salary, position):
+    def __init__(self, name, salary, position, **kwargs):
+        super().__init__(**kwargs)  # Hand any leftovers on to object
         self.name = name
         self.salary = salary
         self.position = position
@@ -9,27 +23,222 @@ class TemplateEmployee:
 
 
 class Manager(TemplateEmployee):
-    def __init__(self, name, salary, position, team_size):
-        # Directly initialize TemplateEmployee
-        TemplateEmployee.__init__(self, name, salary, position)
+    def __init__(self, name, salary, position, team_size, **kwargs):
+        # Initialize the next class in the MRO cooperatively
+        super().__init__(name=name, salary=salary, position=position, **kwargs)
         self.team_size = team_size
 
 
 class Developer(TemplateEmployee):
-    def __init__(self, name, salary, position, language):
-        # Directly initialize TemplateEmployee
-        TemplateEmployee.__init__(self, name, salary, position)
+    def __init__(self, name, salary, position, language, **kwargs):
+        # Initialize the next class in the MRO cooperatively
+        super().__init__(name=name, salary=salary, position=position, **kwargs)
         self.language = language
 
 
 class TeamLead(Manager, Developer):
-    def __init__(self, name, salary, position, language, team_size, responsibility):
-        # Explicitly initialize Manager and Developer
-        Manager.__init__(self, name, salary, position, team_size)
-        Developer.__init__(self, name, salary, position, language)
+    def __init__(self, name, salary, position, language, team_size,
+                 responsibility, **kwargs):
+        # One super() call reaches Manager, Developer and TemplateEmployee
+        # in MRO order, so TemplateEmployee.__init__ runs only once
+        super().__init__(name=name, salary=salary, position=position,
+                         language=language, team_size=team_size, **kwargs)
+        self.responsibility = responsibility
+
+
+# Slotted variants of the same hierarchy: __slots__ stores attributes in
+# fixed slots instead of a per-instance __dict__, which saves memory and
+# speeds up attribute access when there are millions of employees.
+class SlottedEmployee:
+    __slots__ = ("name", "salary", "position")
+
+    def __init__(self, name, salary, position, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.salary = salary
+        self.position = position
+
+    work = TemplateEmployee.work  # Same behaviour as the dict-based class
+
+
+# Two bases that both add slots cannot be combined (a "layout conflict"),
+# so the Manager and Developer behaviour lives in slot-free role classes
+# and each concrete class declares the slots it actually needs. The roles
+# have nowhere to store their attribute, so they are abstract: the slot in
+# a concrete class is what implements it.
+#
+# Because of this, SlottedTeamLead is a ManagerRole and a DeveloperRole but
+# NOT a SlottedManager or SlottedDeveloper (unlike TeamLead, which is a
+# Manager and a Developer). Use the role classes in isinstance() checks.
+class ManagerRole(SlottedEmployee, metaclass=ABCMeta):
+    __slots__ = ()
+
+    def __init__(self, name, salary, position, team_size, **kwargs):
+        super().__init__(name=name, salary=salary, position=position, **kwargs)
+        self.team_size = team_size
+
+    @property
+    @abstractmethod
+    def team_size(self):
+        ...  # Provided by a "team_size" slot
+
+
+class DeveloperRole(SlottedEmployee, metaclass=ABCMeta):
+    __slots__ = ()
+
+    def __init__(self, name, salary, position, language, **kwargs):
+        super().__init__(name=name, salary=salary, position=position, **kwargs)
+        self.language = language
+
+    @property
+    @abstractmethod
+    def language(self):
+        ...  # Provided by a "language" slot
+
+
+class SlottedManager(ManagerRole):
+    __slots__ = ("team_size",)
+
+
+class SlottedDeveloper(DeveloperRole):
+    __slots__ = ("language",)
+
+
+class SlottedTeamLead(ManagerRole, DeveloperRole):
+    __slots__ = ("team_size", "language", "responsibility")
+
+    def __init__(self, name, salary, position, language, team_size,
+                 responsibility, **kwargs):
+        super().__init__(name=name, salary=salary, position=position,
+                         language=language, team_size=team_size, **kwargs)
         self.responsibility = responsibility
 
 
+# Payroll aggregation: salaries are grouped by position, class or language.
+# Each group keeps a running total and a sorted list of salaries, so totals,
+# means and percentiles are available at any time, and adding or changing
+# one employee only touches that employee's group. The initial employees
+# are appended and each group is sorted once (with NumPy when installed);
+# later adds use insort.
+class PayrollAggregator:
+    GROUPINGS = {
+        "position": lambda employee: employee.position,
+        "class": lambda employee: type(employee).__name__,
+        "language": lambda employee: getattr(employee, "language", None),
+    }
+
+    def __init__(self, employees=(), by="position"):
+        if by not in self.GROUPINGS:
+            raise ValueError(f"Cannot group by {by!r}; use one of "
+                             f"{', '.join(self.GROUPINGS)}.")
+        self._group_of = self.GROUPINGS[by]
+        self._salaries = {}  # group -> sorted salaries
+        self._totals = {}  # group -> salary total
+        self._members = {}  # id(employee) -> (employee, group, salary)
+        for employee in employees:
+            salaries, salary = self._track(employee)
+            salaries.append(salary)
+        for salaries in self._salaries.values():
+            _sort_salaries(salaries)
+
+    def add(self, employee):
+        salaries, salary = self._track(employee)
+        bisect.insort(salaries, salary)
+
+    # Record a new member and its group total; return the group's salary
+    # list and the salary for the caller to insert.
+    def _track(self, employee):
+        if id(employee) in self._members:
+            raise ValueError(f"{employee.name} is already in the payroll; "
+                             f"use update() after changing them.")
+        group = self._group_of(employee)
+        salary = employee.salary
+        self._members[id(employee)] = (employee, group, salary)
+        self._totals[group] = self._totals.get(group, 0) + salary
+        return self._salaries.setdefault(group, []), salary
+
+    def remove(self, employee):
+        _, group, salary = self._members.pop(id(employee))
+        salaries = self._salaries[group]
+        del salaries[bisect.bisect_left(salaries, salary)]
+        self._totals[group] -= salary
+        if not salaries:
+            del self._salaries[group], self._totals[group]
+
+    # Call after changing an employee's salary, position or language.
+    def update(self, employee):
+        self.remove(employee)
+        self.add(employee)
+
+    def groups(self):
+        return list(self._salaries)
+
+    def count(self, group):
+        return len(self._salaries[group])
+
+    def total(self, group):
+        return self._totals[group]
+
+    def mean(self, group):
+        return self._totals[group] / len(self._salaries[group])
+
+    # Percentile (0-100) with linear interpolation between sorted salaries.
+    def percentile(self, group, percent):
+        if not 0 <= percent <= 100:
+            raise ValueError(f"percent must be between 0 and 100, "
+                             f"not {percent}.")
+        salaries = self._salaries[group]
+        position = (len(salaries) - 1) * percent / 100
+        lower = int(position)
+        upper = min(lower + 1, len(salaries) - 1)
+        fraction = position - lower
+        return salaries[lower] + (salaries[upper] - salaries[lower]) * fraction
+
+    def summary(self):
+        return {group: {"count": self.count(group), "total": self.total(group),
+                        "mean": self.mean(group),
+                        "median": self.percentile(group, 50)}
+                for group in self._salaries}
+
+
+# Sort one group's salaries in place. Large groups of plain numbers are
+# ordered with a NumPy argsort; the original objects are kept, so ints
+# stay ints and remove() still finds them.
+def _sort_salaries(salaries):
+    if np is not None and len(salaries) >= 1000:
+        values = np.asarray(salaries)
+        if values.dtype.kind in "iuf":
+            order = np.argsort(values, kind="stable").tolist()
+            salaries[:] = list(map(salaries.__getitem__, order))
+            return
+    salaries.sort()
+
+
+# Bulk work() reports: the " is working as a <position>." part of each line
+# is built once per distinct position and reused, so each line costs a
+# single concatenation instead of a full f-string. The cache lives only as
+# long as one report, so it never grows across calls.
+def iter_work_report(employees):
+    suffixes = {}  # position -> line suffix
+    for employee in employees:
+        suffix = suffixes.get(employee.position)
+        if suffix is None:
+            position = employee.position
+            suffix = suffixes[position] = f" is working as a {position}.\n"
+        yield employee.name + suffix  # Same text as work(), plus a newline
+
+
+# Stream the report to a file, writing chunk_size lines at a time.
+def write_work_report(employees, file, chunk_size=1000):
+    lines = []
+    for line in iter_work_report(employees):
+        lines.append(line)
+        if len(lines) == chunk_size:
+            file.write("".join(lines))
+            lines.clear()
+    file.write("".join(lines))
+
+
 # Instances
 manager = Manager("Alex", 70000, "Senior Manager", 3)
 developer = Developer("Bob", 100000, "Senior Developer", "Python/Ruby")
@@ -52,5 +261,16 @@ print("Work: ", team_lead.work())
 print("Language: ", team_lead.language)
 print("Team Size: ", team_lead.team_size)
 print("Responsibility: ", team_lead.responsibility)
+print("MRO: ", " -> ".join(cls.__name__ for cls in TeamLead.__mro__))
+
+slotted_lead = SlottedTeamLead("Dana", 125000, "Team Lead", "Go", 4, "Architect")
+print("\nWork: ", slotted_lead.work())
+print("Has __dict__: ", hasattr(slotted_lead, "__dict__"))  # Output: False
+
+payroll = PayrollAggregator([manager, developer, team_lead], by="class")
+print("\nPayroll by class: ", payroll.summary())
+
+print()
+write_work_report([manager, developer, team_lead], sys.stdout)
 
 
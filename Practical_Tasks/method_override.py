@@ -9,6 +9,23 @@
 
 # Written by: Gower Campbell
 
+from array import array
+import csv
+import io
+import json
+
+try:
+    import numpy as np  # Optional: speeds up bulk driving checks
+except ImportError:
+    np = None
+
+# Minimum age at which a person may drive, unless a jurisdiction overrides it.
+DRIVING_AGE = 18
+
+# Fields of a raw character record, in the order used by CSV rows and lists.
+RECORD_FIELDS = ("name", "age", "eye_color", "hair_color")
+
+
 class Person:
     """
     A class to represent a person and validate their attributes.
@@ -37,41 +54,205 @@ class Person:
         self.hair_color = hair_color
 
     def can_drive(self):
+        """
+        Prints whether the character is old enough to drive. Subclasses only
+        override driving_message.
+        """
+        print(self.driving_message())
+
+    def driving_message(self):
         """
         Placeholder method meant to be overridden in subclasses (Adult, Child).
         """
         raise NotImplementedError(
             """\nThis method should be overridden in subclasses.""")
 
+    def format_info(self):
+        """
+        Formats the character's information without printing it.
+
+        :return: The text shown by display_info (without the final newline).
+        """
+        return "\n".join((
+            "\n--- Character Information ---",
+            f"Name: {self.name}",
+            f"Age: {self.age}",
+            f"Eye Color: {self.eye_color.capitalize()}",
+            f"Hair Color: {self.hair_color.capitalize()}",
+            self.driving_message(),  # Driving eligibility
+            "-----------------------------"))
+
     def display_info(self):
         """
         Displays the character's information in a formatted way.
         """
-        print("\n--- Character Information ---")
-        print(f"Name: {self.name}")
-        print(f"Age: {self.age}")
-        print(f"Eye Color: {self.eye_color.capitalize()}")
-        print(f"Hair Color: {self.hair_color.capitalize()}")
-        self.can_drive()  # Display driving eligibility
-        print("-----------------------------")
+        print(self.format_info())
 
 
 class Adult(Person):
-    def can_drive(self):
+    def driving_message(self):
         """
         Overridden method for adults.
-        Prints a message indicating that the adult is old enough to drive.
+        :return: A message saying that the adult is old enough to drive.
         """
-        print(f"\n{self.name} is Old enough to Drive.")
+        return f"\n{self.name} is Old enough to Drive."
 
 
 class Child(Person):
-    def can_drive(self):
+    def driving_message(self):
         """
         Overridden method for children.
-        Prints a message indicating that the child is too young to drive.
+        :return: A message saying that the child is too young to drive.
+        """
+        return f"\n{self.name} is too Young to Drive."
+
+
+class Validator:
+    """
+    Base class for reusable input validators.
+
+    Everything a validator needs (lookup tables, error message) is built
+    once in __init__, so checking a value does no extra work per call.
+
+    Attributes:
+        message (str): The prebuilt message used for an invalid value.
+    """
+    message = "Invalid value."
+
+    def explain(self, value):
+        """
+        Builds the console text printed by ask() for an invalid value.
+        Subclasses override this to keep their prompt's original wording.
+
+        :param value: The raw value that failed the check.
+        :return: The text to print.
+        """
+        return f"\nInvalid input: {self.message}"
+
+    def check(self, value):
+        """
+        Placeholder method meant to be overridden in subclasses.
+
+        :param value: The raw value to check.
+        :return: The cleaned value, or None if the value is invalid.
+        """
+        raise NotImplementedError(
+            """\nThis method should be overridden in subclasses.""")
+
+    def validate(self, value):
+        """
+        Checks a single value.
+
+        :param value: The raw value to check.
+        :return: The cleaned value.
+        :raises ValueError: If the value is invalid.
+        """
+        result = self.check(value)
+        if result is None:
+            raise ValueError(self.message)
+        return result
+
+    def validate_all(self, values):
+        """
+        Checks a whole batch of values in one loop.
+
+        :param values: An iterable of raw values.
+        :return: A list with the cleaned value, or None, for every value.
         """
-        print(f"\n{self.name} is too Young to Drive.")
+        check = self.check
+        return [check(value) for value in values]
+
+    def ask(self, prompt, read=input):
+        """
+        Keeps reading values until a valid one is given.
+
+        :param prompt: The prompt message displayed to the user.
+        :param read: A callable taking the prompt and returning a string,
+            e.g. input, or a reader over a list, file or socket.
+        :return: The first valid, cleaned value.
+        """
+        while True:
+            value = read(prompt)
+            result = self.check(value)
+            if result is not None:
+                return result
+            print(self.explain(value))
+
+
+class StringValidator(Validator):
+    """
+    Accepts strings made up only of letters.
+    """
+    message = "Please enter only letters."
+
+    def check(self, value):
+        value = value.strip()  # Strip surrounding whitespace
+        return value if value.isalpha() else None
+
+    def explain(self, value):
+        return "\nInvalid input. Please enter only letters."
+
+
+class AgeValidator(Validator):
+    """
+    Accepts non-negative whole numbers, given as strings or integers.
+    """
+    message = "Age must be a whole number that is not negative."
+
+    def check(self, value):
+        if isinstance(value, bool):  # True/False are not ages
+            return None
+        try:
+            age = int(value) if isinstance(value, str) else value.__index__()
+        except (AttributeError, ValueError):
+            return None
+        return age if age >= 0 else None
+
+    def explain(self, value):
+        # Only runs for a failed value, so re-parsing here costs the
+        # batch path nothing and gives the prompt its original message.
+        try:
+            int(value)
+        except (TypeError, ValueError) as e:
+            return f"\nInvalid input: {e}"
+        return "\nInvalid input: \nAge cannot be negative."
+
+
+class ColorValidator(Validator):
+    """
+    Accepts colours from a fixed set, ignoring case and whitespace.
+    """
+
+    def __init__(self, valid_colors):
+        """
+        Builds the lookup table and error messages once.
+
+        :param valid_colors: A set of valid colour options.
+        """
+        valid_colors = tuple(valid_colors)
+        self.valid_colors = frozenset(valid_colors)
+        self._lookup = {color.casefold(): color for color in self.valid_colors}
+        self.message = (f"Please enter one of the following: "
+                        f"{', '.join(sorted(self.valid_colors))}.")
+        # The prompt lists the colours in the order they were given
+        self._console_message = (f"Invalid input: Please enter one of the "
+                                 f"following: {', '.join(valid_colors)}.")
+
+    def check(self, value):
+        return self._lookup.get(value.strip().casefold())
+
+    def explain(self, value):
+        return self._console_message
+
+
+NAME_VALIDATOR = StringValidator()
+AGE_VALIDATOR = AgeValidator()
+EYE_COLOR_VALIDATOR = ColorValidator(Person.VALID_EYE_COLORS)
+HAIR_COLOR_VALIDATOR = ColorValidator(Person.VALID_HAIR_COLORS)
+_COLOR_VALIDATORS = {
+    EYE_COLOR_VALIDATOR.valid_colors: EYE_COLOR_VALIDATOR,
+    HAIR_COLOR_VALIDATOR.valid_colors: HAIR_COLOR_VALIDATOR,
+}
 
 
 def get_valid_age():
@@ -81,17 +262,7 @@ def get_valid_age():
 
     :return: A valid age (integer >= 0).
     """
-    valid_age = False
-    while not valid_age:
-        try:
-            age = int(input("\nPlease input your age: "))  #Input an age
-            if age < 0:
-                raise ValueError("\nAge cannot be negative.")
-            # Validation for non-negative age
-            valid_age = True
-            return age
-        except ValueError as e:
-            print(f"\nInvalid input: {e}")  # Error message for invalid input
+    return AGE_VALIDATOR.ask("\nPlease input your age: ")
 
 
 def get_valid_string(prompt):
@@ -101,13 +272,7 @@ def get_valid_string(prompt):
     :param prompt: The prompt message displayed to the user.
     :return: A valid string.
     """
-    valid_string = False
-    while not valid_string:
-        value = input(prompt).strip()  # Get and strip input
-        if value.isalpha():  # Check if the string contains only letters
-            valid_string = True
-            return value
-        print("\nInvalid input. Please enter only letters.")
+    return NAME_VALIDATOR.ask(prompt)
 
 
 def get_valid_color(prompt, valid_colors):
@@ -118,14 +283,361 @@ def get_valid_color(prompt, valid_colors):
     :param valid_colors: A set of valid colour options.
     :return: A valid colour from the set.
     """
-    valid_color = False
-    while not valid_color:
-        value = input(prompt).strip().lower()  # Get and format input
-        if value in valid_colors:  # Validate colour
-            valid_color = True
-            return value
-        print(f"""Invalid input: Please enter one of the following: {', '.join(
-            valid_colors)}.""")
+    key = frozenset(valid_colors)
+    validator = _COLOR_VALIDATORS.get(key)
+    if validator is None:  # Build each new colour set's validator only once
+        validator = _COLOR_VALIDATORS[key] = ColorValidator(valid_colors)
+    return validator.ask(prompt)
+
+
+def create_person(name, age, eye_color, hair_color):
+    """
+    Creates an Adult or a Child depending on the age of the person.
+
+    :param name: The name of the person.
+    :param age: The age of the person.
+    :param eye_color: The eye colour of the person.
+    :param hair_color: The hair colour of the person.
+    :return: An Adult if the age is DRIVING_AGE or over, otherwise a Child.
+    """
+    if age >= DRIVING_AGE:
+        return Adult(name, age, eye_color, hair_color)  # Adult Object
+    return Child(name, age, eye_color, hair_color)  # Child Object
+
+
+def validate_record(record):
+    """
+    Validates a raw character record using the same rules as the prompts.
+
+    :param record: A dict keyed by RECORD_FIELDS, a list or tuple (e.g. a
+        CSV row) in RECORD_FIELDS order, or a JSON line holding either.
+    :return: A tuple of (name, age, eye_color, hair_color).
+    :raises ValueError: If the record is malformed or a value is invalid.
+    """
+    if isinstance(record, str):
+        record = json.loads(record)  # JSONDecodeError is a ValueError
+    if isinstance(record, dict):
+        try:
+            values = [record[field] for field in RECORD_FIELDS]
+        except KeyError as e:
+            raise ValueError(f"Missing field: {e.args[0]}.")
+    elif isinstance(record, (list, tuple)):
+        values = record
+        if len(values) != len(RECORD_FIELDS):
+            raise ValueError(
+                f"Expected {len(RECORD_FIELDS)} fields, got {len(values)}.")
+    else:
+        # e.g. None, or a JSON line holding a number or null
+        raise ValueError(
+            f"Unsupported record type: {type(record).__name__}.")
+
+    name, age, eye_color, hair_color = values
+    for field, value in (("name", name), ("eye_color", eye_color),
+                         ("hair_color", hair_color)):
+        if not isinstance(value, str):  # e.g. a JSON null or number
+            raise ValueError(f"{field} must be text, not "
+                             f"{type(value).__name__}.")
+    return (NAME_VALIDATOR.validate(name),
+            AGE_VALIDATOR.validate(age),
+            EYE_COLOR_VALIDATOR.validate(eye_color),
+            HAIR_COLOR_VALIDATOR.validate(hair_color))
+
+
+def iter_people(records):
+    """
+    Lazily validates records and builds a person for each valid one.
+
+    :param records: An iterable of raw records (see validate_record).
+    :return: A generator of (index, person, error) tuples where exactly one
+        of person and error is None.
+    """
+    for index, record in enumerate(records):
+        try:
+            person = create_person(*validate_record(record))
+        except ValueError as e:
+            yield index, None, str(e)
+        else:
+            yield index, person, None
+
+
+def create_people(records):
+    """
+    Builds persons from a batch of raw records without prompting the user.
+
+    :param records: An iterable of raw records (see validate_record).
+    :return: A tuple of (people, errors) where errors is a list of
+        (index, message) tuples for the records that were rejected.
+    """
+    people = []
+    errors = []
+    for index, person, error in iter_people(records):
+        if error is None:
+            people.append(person)
+        else:
+            errors.append((index, error))
+    return people, errors
+
+
+def read_records(path):
+    """
+    Streams raw records from a CSV file (with a header row) or a JSON Lines
+    file, one line at a time, so large files are never loaded fully.
+
+    :param path: The path of a .csv file or a JSON Lines file.
+    :return: A generator of raw records for validate_record.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():  # Skip blank lines
+                    yield line
+
+
+def driving_eligibility(ages, jurisdictions=None, thresholds=None):
+    """
+    Works out who may drive for a whole population in a single pass, without
+    creating Adult/Child objects or printing anything.
+
+    Uses NumPy when it is installed and plain Python otherwise.
+
+    :param ages: A sequence (list, array or NumPy array) of ages.
+    :param jurisdictions: Optional sequence with one jurisdiction per age.
+    :param thresholds: Optional mapping of jurisdiction to driving age.
+        Jurisdictions missing from it use DRIVING_AGE.
+    :return: A tuple of (mask, count) where mask holds one bool per age and
+        count is the number of people who may drive.
+    :raises ValueError: If jurisdictions and ages differ in length.
+    """
+    if jurisdictions is not None and len(jurisdictions) != len(ages):
+        raise ValueError(f"Got {len(jurisdictions)} jurisdictions for "
+                         f"{len(ages)} ages.")
+    thresholds = thresholds or {}
+    if np is not None:
+        ages = np.asarray(ages)
+        if jurisdictions is None:
+            limits = DRIVING_AGE
+        else:
+            # Look each distinct jurisdiction up once, then broadcast
+            keys, inverse = np.unique(
+                np.asarray(jurisdictions), return_inverse=True)
+            limits = np.array(
+                [thresholds.get(key, DRIVING_AGE) for key in keys])[inverse]
+        mask = ages >= limits
+        return mask, int(np.count_nonzero(mask))
+
+    if jurisdictions is None:
+        mask = [age >= DRIVING_AGE for age in ages]
+    else:
+        get_limit = thresholds.get
+        mask = [age >= get_limit(place, DRIVING_AGE)
+                for age, place in zip(ages, jurisdictions)]
+    return mask, sum(mask)
+
+
+class PersonTable:
+    """
+    A compact, column-based store for large numbers of characters.
+
+    Instead of one Person object per character, each attribute is kept in
+    its own column: names in a list, ages in a typed array, and colours as
+    small integer codes into EYE_COLORS / HAIR_COLORS. Adult and Child
+    objects are only created when a row is requested.
+
+    Attributes:
+        EYE_COLORS (tuple): The eye colours in code order.
+        HAIR_COLORS (tuple): The hair colours in code order.
+    """
+    EYE_COLORS = tuple(sorted(Person.VALID_EYE_COLORS))
+    HAIR_COLORS = tuple(sorted(Person.VALID_HAIR_COLORS))
+    _EYE_CODES = {color: code for code, color in enumerate(EYE_COLORS)}
+    _HAIR_CODES = {color: code for code, color in enumerate(HAIR_COLORS)}
+
+    def __init__(self):
+        """
+        Initializes an empty table.
+        """
+        self.names = []
+        self.ages = array("H")  # Unsigned 16-bit ages
+        self.eye_codes = array("B")  # Index into EYE_COLORS
+        self.hair_codes = array("B")  # Index into HAIR_COLORS
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Builds a table from raw records, skipping invalid ones.
+
+        :param records: An iterable of raw records (see validate_record).
+        :return: A tuple of (table, errors) as in create_people.
+        """
+        table = cls()
+        errors = []
+        for index, record in enumerate(records):
+            try:
+                table.append(*validate_record(record))
+            except (ValueError, OverflowError) as e:
+                errors.append((index, str(e)))
+        return table, errors
+
+    def append(self, name, age, eye_color, hair_color):
+        """
+        Adds a validated character to the end of the table.
+
+        :param name: The name of the person.
+        :param age: The age of the person.
+        :param eye_color: The eye colour of the person.
+        :param hair_color: The hair colour of the person.
+        """
+        eye_code = self._EYE_CODES[eye_color]
+        hair_code = self._HAIR_CODES[hair_color]
+        self.ages.append(age)  # Raises OverflowError before any column grows
+        self.eye_codes.append(eye_code)
+        self.hair_codes.append(hair_code)
+        self.names.append(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Creates an Adult or Child view of a single row, or a new table for a
+        slice of rows.
+
+        :param index: The row number, or a slice of rows.
+        :return: A new Adult or Child with the row's attributes, or a
+            PersonTable holding copies of the sliced columns.
+        """
+        if isinstance(index, slice):
+            table = type(self)()
+            table.names = self.names[index]
+            table.ages = self.ages[index]
+            table.eye_codes = self.eye_codes[index]
+            table.hair_codes = self.hair_codes[index]
+            return table
+        return create_person(
+            self.names[index], self.ages[index],
+            self.EYE_COLORS[self.eye_codes[index]],
+            self.HAIR_COLORS[self.hair_codes[index]])
+
+    def select(self, adult=None, eye_color=None, hair_color=None):
+        """
+        Finds the rows matching every given filter, column by column.
+
+        :param adult: True for adults only, False for children only.
+        :param eye_color: Only keep rows with this eye colour.
+        :param hair_color: Only keep rows with this hair colour.
+        :return: A list of matching row numbers.
+        """
+        if np is not None:
+            return self._select_numpy(adult, eye_color, hair_color)
+        rows = range(len(self))
+        if adult is not None:
+            ages = self.ages
+            rows = [row for row in rows if (ages[row] >= DRIVING_AGE) == adult]
+        if eye_color is not None:
+            code = self._EYE_CODES.get(eye_color.lower())
+            codes = self.eye_codes
+            rows = [row for row in rows if codes[row] == code]
+        if hair_color is not None:
+            code = self._HAIR_CODES.get(hair_color.lower())
+            codes = self.hair_codes
+            rows = [row for row in rows if codes[row] == code]
+        return list(rows)
+
+    def _select_numpy(self, adult, eye_color, hair_color):
+        """
+        Same as select, but combines whole-column boolean masks with NumPy.
+        The columns are viewed in place rather than copied.
+        """
+        if not len(self):
+            return []
+        mask = np.ones(len(self), dtype=bool)
+        if adult is not None:
+            ages = np.frombuffer(self.ages, dtype=np.uint16)
+            mask &= (ages >= DRIVING_AGE) == adult
+        if eye_color is not None:
+            code = self._EYE_CODES.get(eye_color.lower())
+            if code is None:
+                return []
+            mask &= np.frombuffer(self.eye_codes, dtype=np.uint8) == code
+        if hair_color is not None:
+            code = self._HAIR_CODES.get(hair_color.lower())
+            if code is None:
+                return []
+            mask &= np.frombuffer(self.hair_codes, dtype=np.uint8) == code
+        return np.flatnonzero(mask).tolist()
+
+    def driving_eligibility(self, jurisdictions=None, thresholds=None):
+        """
+        Classifies every row in one pass (see driving_eligibility).
+
+        :return: A tuple of (mask, count) over all rows of the table.
+        """
+        return driving_eligibility(self.ages, jurisdictions, thresholds)
+
+    def people(self, rows=None):
+        """
+        Lazily yields Adult/Child views for the given rows.
+
+        :param rows: Row numbers to view, or None for every row.
+        :return: A generator of Adult and Child objects.
+        """
+        if rows is None:
+            rows = range(len(self))
+        for row in rows:
+            yield self[row]
+
+
+def render_people(people, file, fmt="text", chunk_size=1000):
+    """
+    Writes many characters to a file-like object using few, large writes.
+
+    :param people: An iterable of Adult/Child objects.
+    :param file: Any object with a write(str) method (file, StringIO, ...).
+    :param fmt: "text" (same as display_info), "json" (JSON Lines) or "csv".
+    :param chunk_size: How many characters to buffer before each write.
+    :raises ValueError: If fmt is not a supported format.
+    """
+    if fmt not in ("text", "json", "csv"):
+        raise ValueError(f"Unknown format: {fmt}.")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if fmt == "csv":
+        writer.writerow(RECORD_FIELDS + ("can_drive",))
+
+    for count, person in enumerate(people, 1):
+        if fmt == "text":
+            buffer.write(person.format_info())
+            buffer.write("\n")
+        elif fmt == "json":
+            buffer.write(json.dumps({
+                "name": person.name, "age": person.age,
+                "eye_color": person.eye_color,
+                "hair_color": person.hair_color,
+                "can_drive": isinstance(person, Adult)}))
+            buffer.write("\n")
+        else:
+            writer.writerow((person.name, person.age, person.eye_color,
+                             person.hair_color, isinstance(person, Adult)))
+        if count % chunk_size == 0:  # Flush one chunk in a single write
+            file.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    file.write(buffer.getvalue())
+
+
+def format_people(people, fmt="text"):
+    """
+    Renders many characters into a single string (see render_people).
+
+    :param people: An iterable of Adult/Child objects.
+    :param fmt: "text", "json" or "csv".
+    :return: The rendered text.
+    """
+    output = io.StringIO()
+    render_people(people, output, fmt)
+    return output.getvalue()
 
 
 def display_menu():
@@ -153,10 +665,7 @@ def main():
         """\nPlease input a hair color: """, Person.VALID_HAIR_COLORS) 
 
     # Determine if the person is an Adult or Child based on their age
-    if age >= 18:
-        person = Adult(name, age, eye_color, hair_color) # Adult Object
-    else:
-        person = Child(name, age, eye_color, hair_color) # Child Object
+    person = create_person(name, age, eye_color, hair_color)
 
     # Menu loop
     running = True
@@ -8,9 +8,170 @@
 
 # Written by: Gower Campbell & Cogrammer
 
+import os
+import re
+import threading
+
+
+# Hands out increasing IDs one at a time, guarded by a lock so that two
+# threads can never read the same value before it is incremented.
+class LockedIdAllocator:
+    def __init__(self, start):
+        self._next_id = start
+        self._lock = threading.Lock()
+
+    def allocate(self):
+        with self._lock:
+            unique_id = self._next_id
+            self._next_id += 1
+        return unique_id
+
+    # Reserve a whole range of IDs at once and return its first ID.
+    def reserve(self, count):
+        with self._lock:
+            first_id = self._next_id
+            self._next_id += count
+        return first_id
+
+    # Never hand out an ID below next_id, e.g. after importing courses.
+    def advance(self, next_id):
+        with self._lock:
+            self._next_id = max(self._next_id, next_id)
+
+
+# Each thread reserves a block of IDs from a shared LockedIdAllocator and
+# then hands them out without taking the lock again until it runs out.
+class BlockIdAllocator:
+    def __init__(self, start, block_size=1000):
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive number of IDs.")
+        self._blocks = LockedIdAllocator(start)
+        self._block_size = block_size
+        self._local = threading.local()  # Each thread's current block
+        self._floor = start  # Blocks starting below this are dropped
+
+    def allocate(self):
+        local = self._local
+        if (getattr(local, "next_id", None) is None
+                or local.next_id == local.end or local.next_id < self._floor):
+            local.next_id = self._blocks.reserve(self._block_size)
+            local.end = local.next_id + self._block_size
+        unique_id = local.next_id
+        local.next_id += 1
+        return unique_id
+
+    # Threads drop any block that could overlap the skipped IDs.
+    def advance(self, next_id):
+        self._blocks.advance(next_id)
+        self._floor = max(self._floor, next_id)
+
+
+# Keeps the counter in a file locked with flock, so separate processes
+# (and threads) on the same machine never receive the same ID.
+class FileIdAllocator:
+    def __init__(self, path, start):
+        self.path = path
+        self._start = start
+
+    def allocate(self):
+        import fcntl  # Only available on Unix-like systems
+
+        with open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)  # Released when the file closes
+            file.seek(0)
+            text = file.read().strip()
+            unique_id = int(text) if text else self._start
+            file.seek(0)
+            file.truncate()
+            file.write(str(unique_id + 1))
+            file.flush()
+        return unique_id
+
+    def advance(self, next_id):
+        import fcntl
+
+        with open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            file.seek(0)
+            text = file.read().strip()
+            current = int(text) if text else self._start
+            if next_id > current:
+                file.seek(0)
+                file.truncate()
+                file.write(str(next_id))
+                file.flush()
+
+
+# Course text depends only on contact_website and address, so it is kept
+# rendered as a class attribute. _RENDERED maps each source attribute to
+# the attribute holding its text and the function building it.
+def _render_contact_details(contact_website):
+    return f"""\nPlease contact us by visiting our website:
+        {contact_website}"""
+
+
+def _render_head_office(address):
+    return f"\nHead office location: {address}"
+
+
+_RENDERED = {
+    "contact_website": ("_contact_details_text", _render_contact_details),
+    "address": ("_head_office_text", _render_head_office),
+}
+
+
+# Holds a class's contact_website or address. Reading it gives the plain
+# value; setting it on one course also renders the text for that course.
+class _RenderedAttribute:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.value
+        return instance.__dict__.get(self.name, self.value)
+
+    def __set__(self, instance, value):
+        target, render = _RENDERED[self.name]
+        instance.__dict__[self.name] = value
+        instance.__dict__[target] = render(value)
+
+    def __delete__(self, instance):
+        del instance.__dict__[self.name]
+        del instance.__dict__[_RENDERED[self.name][0]]
+
+
+# Metaclass that renders the text once, on the class that defines
+# contact_website or address, and again whenever either is reassigned on a
+# class. Subclasses that do not set their own value inherit the text along
+# with the value, so reassigning on Course also updates OOPCourse.
+class _RenderedTextMeta(type):
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        for source in _RENDERED:
+            if source in namespace:
+                cls._store(source, namespace[source])
+
+    def __setattr__(cls, name, value):
+        if name in _RENDERED:
+            cls._store(name, value)
+        else:
+            super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        if name in _RENDERED:
+            super().__delattr__(_RENDERED[name][0])
+
+    def _store(cls, source, value):
+        target, render = _RENDERED[source]
+        type.__setattr__(cls, source, _RenderedAttribute(source, value))
+        type.__setattr__(cls, target, render(value))
+
 
 # A Base class for the course:
-class Course:
+class Course(metaclass=_RenderedTextMeta):
     # My Class attributes:
     name = "\nFundamentals of Computer Science"
     contact_website = "\nwww.hyperiondev.com"
@@ -22,29 +183,196 @@ class Course:
 
     # A method to display contact details.
     def contact_details(self):
-        return f"""\nPlease contact us by visiting our website:
-        {self.contact_website}"""
+        return self._contact_details_text
+
+    # Head office location as text, without printing it.
+    def head_office_text(self):
+        return self._head_office_text
 
     # The method to display head office location.
     def head_office_location(self):
-        print("\nHead office location:", self.address)
+        print(self._head_office_text)
+
+
+# Build the contact and head office text of many courses as one string,
+# ready to be written to a report file in a single call.
+def contact_report(courses):
+    return "\n".join(course.contact_details() + course.head_office_text()
+                     for course in courses)
+
+
+# Hi/lo allocator that survives restarts: the file stores the high-water
+# mark (the first ID not yet reserved). Whole blocks are reserved on disk
+# before any of their IDs are handed out, so after a crash the unused rest
+# of a block is skipped and no ID is ever repeated.
+class HiLoIdAllocator:
+    def __init__(self, path, start, block_size=100):
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive number of IDs.")
+        self.path = path
+        self._start = start
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._next_id = self._end = 0  # Empty block, reserved on first use
+
+    def allocate(self):
+        with self._lock:
+            if self._next_id == self._end:
+                self._next_id = self._reserve_block()
+                self._end = self._next_id + self._block_size
+            unique_id = self._next_id
+            self._next_id += 1
+        return unique_id
+
+    # Move the high-water mark to at least next_id. The current block is
+    # dropped if it could overlap the skipped IDs.
+    def advance(self, next_id):
+        with self._lock:
+            if self._next_id < next_id:
+                self._move_mark(lambda mark: max(mark, next_id))
+                self._next_id = self._end = 0
+
+    def _reserve_block(self):
+        return self._move_mark(lambda mark: mark + self._block_size)
+
+    # Read the high-water mark, then durably replace it with update(mark)
+    # and return the old mark. The mark file is replaced rather than
+    # rewritten, so processes hold a lock on a separate file that is never
+    # replaced.
+    def _move_mark(self, update):
+        import fcntl  # Only available on Unix-like systems
+
+        with open(self.path + ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)  # Released when the file closes
+            try:
+                with open(self.path) as file:
+                    mark = int(file.read())
+            except FileNotFoundError:
+                mark = self._start
+
+            # Write a temporary file and rename it over the old one, so a
+            # crash leaves either the old or the new mark, never a
+            # half-written file.
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w") as file:
+                file.write(str(update(mark)))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        return mark
+
+
+# Registry of courses with hash indexes on course_id and trainer, plus an
+# inverted index from each description word to the courses using it, so
+# lookups never have to scan every course. Registration is opt-in: courses
+# built with create() (or passed to add()) are indexed, others are not.
+class CourseCatalog:
+    def __init__(self):
+        self._by_id = {}
+        self._by_trainer = {}  # trainer -> {course_id: course}
+        self._by_word = {}  # word -> {course_id: course}
+        self._indexed = {}  # course_id -> (trainer, words) as indexed
+
+    def __len__(self):
+        return len(self._by_id)
+
+    # Split a description into lowercase words for the inverted index.
+    @staticmethod
+    def _words(text):
+        return set(re.findall(r"\w+", text.lower()))
+
+    # Build an OOPCourse and register it in one step.
+    def create(self, name, description, trainer, course_id=None):
+        course = OOPCourse(name, description, trainer, course_id=course_id)
+        self.add(course)
+        return course
+
+    def add(self, course):
+        course_id = course.course_id
+        if course_id in self._by_id:
+            raise ValueError(f"Duplicate course ID: {course_id}")
+        trainer, words = course.trainer, self._words(course.description)
+        self._by_id[course_id] = course
+        self._indexed[course_id] = (trainer, words)
+        self._by_trainer.setdefault(trainer, {})[course_id] = course
+        for word in words:
+            self._by_word.setdefault(word, {})[course_id] = course
+
+    # Uses the trainer and words the course was indexed under, so courses
+    # edited after add() are still removed cleanly.
+    def remove(self, course):
+        course_id = course.course_id
+        del self._by_id[course_id]
+        trainer, words = self._indexed.pop(course_id)
+        self._discard(self._by_trainer, trainer, course_id)
+        for word in words:
+            self._discard(self._by_word, word, course_id)
+
+    # Remove one course from an index bucket, dropping the bucket if empty.
+    @staticmethod
+    def _discard(index, key, course_id):
+        bucket = index[key]
+        del bucket[course_id]
+        if not bucket:
+            del index[key]
+
+    def get(self, course_id):
+        return self._by_id.get(course_id)
+
+    def by_trainer(self, trainer):
+        return list(self._by_trainer.get(trainer, {}).values())
+
+    # Courses whose description contains every word of the query.
+    def search(self, query):
+        buckets = [self._by_word.get(word, {}) for word in self._words(query)]
+        if not buckets:
+            return []
+        buckets.sort(key=len)  # Start from the rarest word
+        smallest, rest = buckets[0], buckets[1:]
+        return [course for course_id, course in smallest.items()
+                if all(course_id in bucket for bucket in rest)]
+
+    # Yield every course as a plain dict, e.g. for csv.DictWriter or JSON.
+    def export_rows(self):
+        for course in self._by_id.values():
+            yield {"course_id": course.course_id, "name": course.name,
+                   "description": course.description,
+                   "trainer": course.trainer}
+
+    # Rebuild courses from exported rows, keeping their original IDs. The
+    # ID allocator is moved past every imported "#<number>" ID, so later
+    # create() calls cannot hand one out again.
+    def import_rows(self, rows):
+        courses = []
+        for row in rows:
+            course_id = row["course_id"]
+            courses.append(self.create(row["name"], row["description"],
+                                       row["trainer"], course_id=course_id))
+            match = re.fullmatch(r"#(\d+)", course_id)
+            if match:
+                OOPCourse.id_allocator.advance(int(match.group(1)) + 1)
+        return courses
 
 
 # Subclass for the Object-Oriented Programming course.
 class OOPCourse(Course):
-    _current_id = 12345
+    # Shared ID allocator; swap in a BlockIdAllocator or FileIdAllocator
+    # for heavily threaded or multi-process use, or a HiLoIdAllocator to
+    # keep IDs unique across restarts.
+    id_allocator = LockedIdAllocator(12345)
 
-    def __init__(self, name, description, trainer):
+    def __init__(self, name, description, trainer, course_id=None):
         super().__init__(name)  # Inherit properties from the Course class
         self.description = description  # Set course description
         self.trainer = trainer  # Set trainer name
-        self.course_id = self._generate_unique_id()  # Generate a unique ID
+        if course_id is None:
+            course_id = self._generate_unique_id()  # Generate a unique ID
+        self.course_id = course_id
 
     @classmethod
     def _generate_unique_id(cls):
-        unique_id = cls._current_id  # Accessing the current unique ID
-        cls._current_id += 1  # Increment this unique ID for the next course
-        return f"\n#{unique_id}"  # Returns the ID in the correct format
+        unique_id = cls.id_allocator.allocate()  # Safe across threads
+        return f"#{unique_id}"  # Returns the ID in the correct format
 
     def trainer_details(self):
         print(f"""\nThis course is about {self.description} and it is 